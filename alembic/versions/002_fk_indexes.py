@@ -0,0 +1,38 @@
+"""Index remaining foreign key columns
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+PostgreSQL does not index foreign key columns automatically. Without
+these, cascading deletes from building_elements and
+property_set_definitions scan the child tables.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from alembic import op
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+# revision identifiers, used by Alembic.
+revision: str = "002_fk_indexes"
+down_revision: str | None = "001_initial_schema"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create foreign key indexes."""
+    op.create_index("idx_spaces_element", "spaces", ["element_id"])
+    op.create_index("idx_type_props_pset", "type_properties", ["pset_definition_id"])
+
+
+def downgrade() -> None:
+    """Drop foreign key indexes."""
+    op.drop_index("idx_type_props_pset", table_name="type_properties")
+    op.drop_index("idx_spaces_element", table_name="spaces")
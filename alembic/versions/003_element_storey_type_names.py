@@ -0,0 +1,57 @@
+"""Denormalize storey and type names onto building elements
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+Element queries read the storey and type name for every row. Storing
+them on building_elements avoids loading storeys and element_types
+alongside each query. Elements are written once per import, so the
+copies do not drift.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003_element_storey_type_names"
+down_revision: str | None = "002_fk_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add and backfill storey_name and type_name."""
+    op.add_column("building_elements", sa.Column("storey_name", sa.String(255), nullable=True))
+    op.add_column("building_elements", sa.Column("type_name", sa.String(255), nullable=True))
+
+    op.execute(
+        """
+        UPDATE building_elements AS e
+        SET storey_name = s.name
+        FROM storeys AS s
+        WHERE e.storey_id = s.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE building_elements AS e
+        SET type_name = t.name
+        FROM element_types AS t
+        WHERE e.type_id = t.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop storey_name and type_name."""
+    op.drop_column("building_elements", "type_name")
+    op.drop_column("building_elements", "storey_name")
@@ -0,0 +1,49 @@
+"""Index a prefix of element property values
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+property_value is unbounded Text. A btree over the full value fails the
+insert once a row exceeds the index row size limit (~2.7 kB) and copies
+every long value into the index. Index the first 64 characters instead;
+equality lookups add a matching left() predicate and recheck the full
+value on the heap row.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004_props_value_prefix_index"
+down_revision: str | None = "003_element_storey_type_names"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace the full-value index with a prefix expression index."""
+    op.drop_index("idx_props_name_value", table_name="element_properties")
+    op.create_index(
+        "idx_props_name_value_prefix",
+        "element_properties",
+        ["property_name", sa.text("left(property_value, 64)")],
+    )
+
+
+def downgrade() -> None:
+    """Restore the full-value index."""
+    op.drop_index("idx_props_name_value_prefix", table_name="element_properties")
+    op.create_index(
+        "idx_props_name_value",
+        "element_properties",
+        ["property_name", "property_value"],
+    )
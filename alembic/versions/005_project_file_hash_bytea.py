@@ -0,0 +1,47 @@
+"""Store project file hashes as raw SHA-256 digests
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+original_file_hash held the 64-character hex digest. The raw 32-byte
+digest halves the column and its unique index and needs no hex
+encoding on the way in or out.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005_project_file_hash_bytea"
+down_revision: str | None = "004_props_value_prefix_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Convert original_file_hash from hex text to bytea."""
+    op.alter_column(
+        "ifc_projects",
+        "original_file_hash",
+        type_=sa.LargeBinary(32),
+        postgresql_using="decode(original_file_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    """Convert original_file_hash back to hex text."""
+    op.alter_column(
+        "ifc_projects",
+        "original_file_hash",
+        type_=sa.String(64),
+        postgresql_using="encode(original_file_hash, 'hex')",
+    )
@@ -0,0 +1,52 @@
+"""Store element geometry as double precision
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+The domain model holds element dimensions and positions as floats.
+Reading them from NUMERIC built a Decimal per value only to convert it
+straight back. float8 is fixed-width and maps to float directly.
+Space areas and volumes stay NUMERIC; the DIN 277 and WoFlV
+calculations work on Decimal.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006_element_geometry_double"
+down_revision: str | None = "005_project_file_hash_bytea"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_DECIMAL_TYPES = {
+    "length_m": sa.DECIMAL(10, 4),
+    "width_m": sa.DECIMAL(10, 4),
+    "height_m": sa.DECIMAL(10, 4),
+    "area_m2": sa.DECIMAL(12, 4),
+    "volume_m3": sa.DECIMAL(12, 4),
+    "position_x": sa.DECIMAL(12, 4),
+    "position_y": sa.DECIMAL(12, 4),
+    "position_z": sa.DECIMAL(12, 4),
+}
+
+
+def upgrade() -> None:
+    """Convert element geometry columns to double precision."""
+    for column in _DECIMAL_TYPES:
+        op.alter_column("building_elements", column, type_=sa.Double())
+
+
+def downgrade() -> None:
+    """Convert element geometry columns back to NUMERIC."""
+    for column, type_ in _DECIMAL_TYPES.items():
+        op.alter_column("building_elements", column, type_=type_)
@@ -232,11 +232,11 @@ class AccessibilityCheckService:
         # Check each door
         non_compliant = [
             d for d in doors_with_width
-            if float(d.width_m) < min_width
+            if (d.width_m or 0.0) < min_width
         ]
 
         if non_compliant:
-            min_found = min(float(d.width_m) for d in non_compliant)
+            min_found = min(d.width_m or 0.0 for d in non_compliant)
             return [AccessibilityCheck(
                 check_id="ACC_DOOR_001",
                 name="Door Width Check",
@@ -289,7 +289,7 @@ class AccessibilityCheckService:
 
         non_compliant = [
             d for d in doors_with_height
-            if float(d.height_m) < min_height
+            if (d.height_m or 0.0) < min_height
         ]
 
         if non_compliant:
@@ -528,7 +528,7 @@ class AccessibilityCheckService:
                 message=f"{len(stairs)} stairs found but no width data",
             )]
 
-        narrow = [s for s in stairs_with_width if float(s.width_m) < min_width]
+        narrow = [s for s in stairs_with_width if (s.width_m or 0.0) < min_width]
 
         if narrow:
             return [AccessibilityCheck(
@@ -492,30 +492,32 @@ class MaterialTakeoffService:
 
     def _calculate_wall_area(self, wall: BuildingElement) -> Decimal:
         """Calculate wall area in m\u00b2."""
-        length = wall.length_m or Decimal("0")
-        height = wall.height_m or Decimal("2.80")  # Default storey height
+        length = wall.length_m_decimal or Decimal("0")
+        height = wall.height_m_decimal or Decimal("2.80")  # Default storey height
         return length * height
 
     def _calculate_opening_area(self, element: BuildingElement) -> Decimal:
         """Calculate opening area (window/door) in m\u00b2."""
-        width = element.width_m or Decimal("0")
-        height = element.height_m or Decimal("0")
+        width = element.width_m_decimal or Decimal("0")
+        height = element.height_m_decimal or Decimal("0")
         return width * height
 
     def _calculate_slab_area(self, slab: BuildingElement) -> Decimal:
         """Calculate slab area in m\u00b2."""
-        if slab.area_m2:
-            return slab.area_m2
-        length = slab.length_m or Decimal("0")
-        width = slab.width_m or Decimal("0")
+        area = slab.area_m2_decimal
+        if area:
+            return area
+        length = slab.length_m_decimal or Decimal("0")
+        width = slab.width_m_decimal or Decimal("0")
         return length * width
 
     def _calculate_column_volume(self, column: BuildingElement) -> Decimal:
         """Calculate column volume in m\u00b3."""
-        if column.volume_m3:
-            return column.volume_m3
+        volume = column.volume_m3_decimal
+        if volume:
+            return volume
         # Estimate from dimensions
-        width = column.width_m or Decimal("0.3")
-        height = column.height_m or Decimal("3.0")
+        width = column.width_m_decimal or Decimal("0.3")
+        height = column.height_m_decimal or Decimal("3.0")
         # Assume square cross-section
         return width * width * height
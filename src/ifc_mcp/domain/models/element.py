@@ -4,16 +4,103 @@ Represents a building element (wall, door, window, etc.) from IFC.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime
+import itertools
+import os
+from dataclasses import KW_ONLY, dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
 from ifc_mcp.domain.value_objects import FireRating, GlobalId
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from datetime import datetime
+
+
+class _IdSource:
+    """Process-unique element ID generator.
+
+    One random 64-bit prefix per process plus a counter in the low 64 bits,
+    so creating an element does not need an os.urandom() call.
+    """
+
+    __slots__ = ("_counter", "_prefix")
+
+    def __init__(self) -> None:
+        self.reseed()
+
+    def reseed(self) -> None:
+        """Draw a new prefix and restart the counter."""
+        self._prefix = int.from_bytes(os.urandom(8), "big") << 64
+        self._counter = itertools.count(1)
+
+    def next_id(self) -> UUID:
+        """Generate a process-unique UUID."""
+        return UUID(int=self._prefix | next(self._counter))
+
+
+_ID_SOURCE = _IdSource()
+
+# A forked worker inherits the parent's prefix and counter; reseed it so
+# parent and child cannot hand out the same IDs.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_ID_SOURCE.reseed)
+
+
+def _fast_uuid() -> UUID:
+    """Generate a process-unique element UUID without a syscall."""
+    return _ID_SOURCE.next_id()
+
+
+@lru_cache(maxsize=65536)
+def _parse_global_id(value: str) -> GlobalId:
+    """Validate a GlobalId string, reusing the instance for repeated IDs."""
+    return GlobalId(value)
+
+
+# Property lookup keys for derived properties, in priority order
+_FIRE_RATING_KEYS: tuple[tuple[str, str], ...] = (
+    ("Pset_WallCommon", "FireRating"),
+    ("Pset_DoorCommon", "FireRating"),
+    ("Pset_WindowCommon", "FireRating"),
+    ("Pset_SlabCommon", "FireRating"),
+    ("Pset_CurtainWallCommon", "FireRating"),
+)
+_ACOUSTIC_RATING_KEYS: tuple[tuple[str, str], ...] = (
+    ("Pset_WallCommon", "AcousticRating"),
+    ("Pset_DoorCommon", "AcousticRating"),
+    ("Pset_WindowCommon", "AcousticRating"),
+)
+_U_VALUE_KEYS: tuple[tuple[str, str], ...] = (
+    ("Pset_WallCommon", "ThermalTransmittance"),
+    ("Pset_DoorCommon", "ThermalTransmittance"),
+    ("Pset_WindowCommon", "ThermalTransmittance"),
+    ("Pset_SlabCommon", "ThermalTransmittance"),
+)
+
+
+_DRYWALL_KEYWORDS: tuple[str, ...] = (
+    "gips", "gypsum", "drywall", "rigips", "knauf",
+    "fermacell", "plasterboard", "trockenbau",
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_drywall_name(name: str) -> bool:
+    """Check a material or type name for drywall keywords.
+
+    Models reuse a small set of material names across many elements,
+    so the keyword scan runs once per distinct name.
+    """
+    lowered = name.lower()
+    return any(kw in lowered for kw in _DRYWALL_KEYWORDS)
+
+
 class ElementCategory(str, Enum):
     """Building element category classification."""
 
@@ -47,33 +134,49 @@ class ElementCategory(str, Enum):
         Returns:
             Corresponding ElementCategory
         """
-        mapping = {
-            "IfcWall": cls.WALL,
-            "IfcWallStandardCase": cls.WALL_STANDARD_CASE,
-            "IfcDoor": cls.DOOR,
-            "IfcWindow": cls.WINDOW,
-            "IfcSlab": cls.SLAB,
-            "IfcRoof": cls.ROOF_SLAB,
-            "IfcColumn": cls.COLUMN,
-            "IfcBeam": cls.BEAM,
-            "IfcStair": cls.STAIR,
-            "IfcStairFlight": cls.STAIR,
-            "IfcRamp": cls.RAMP,
-            "IfcRampFlight": cls.RAMP,
-            "IfcCurtainWall": cls.CURTAIN_WALL,
-            "IfcCovering": cls.COVERING,
-            "IfcSpace": cls.SPACE,
-            "IfcOpeningElement": cls.OPENING,
-            "IfcRailing": cls.RAILING,
-            "IfcFurniture": cls.FURNITURE,
-            "IfcFurnishingElement": cls.FURNITURE,
-            # Distribution elements
-            "IfcDistributionElement": cls.DISTRIBUTION_ELEMENT,
-            "IfcFlowSegment": cls.DISTRIBUTION_ELEMENT,
-            "IfcFlowFitting": cls.DISTRIBUTION_ELEMENT,
-            "IfcFlowTerminal": cls.DISTRIBUTION_ELEMENT,
-        }
-        return mapping.get(ifc_class, cls.OTHER)
+        return _IFC_CLASS_MAP.get(ifc_class, cls.OTHER)
+
+
+# IFC entity class -> element category
+_IFC_CLASS_MAP: dict[str, ElementCategory] = {
+    "IfcWall": ElementCategory.WALL,
+    "IfcWallStandardCase": ElementCategory.WALL_STANDARD_CASE,
+    "IfcDoor": ElementCategory.DOOR,
+    "IfcWindow": ElementCategory.WINDOW,
+    "IfcSlab": ElementCategory.SLAB,
+    "IfcRoof": ElementCategory.ROOF_SLAB,
+    "IfcColumn": ElementCategory.COLUMN,
+    "IfcBeam": ElementCategory.BEAM,
+    "IfcStair": ElementCategory.STAIR,
+    "IfcStairFlight": ElementCategory.STAIR,
+    "IfcRamp": ElementCategory.RAMP,
+    "IfcRampFlight": ElementCategory.RAMP,
+    "IfcCurtainWall": ElementCategory.CURTAIN_WALL,
+    "IfcCovering": ElementCategory.COVERING,
+    "IfcSpace": ElementCategory.SPACE,
+    "IfcOpeningElement": ElementCategory.OPENING,
+    "IfcRailing": ElementCategory.RAILING,
+    "IfcFurniture": ElementCategory.FURNITURE,
+    "IfcFurnishingElement": ElementCategory.FURNITURE,
+    # Distribution elements
+    "IfcDistributionElement": ElementCategory.DISTRIBUTION_ELEMENT,
+    "IfcFlowSegment": ElementCategory.DISTRIBUTION_ELEMENT,
+    "IfcFlowFitting": ElementCategory.DISTRIBUTION_ELEMENT,
+    "IfcFlowTerminal": ElementCategory.DISTRIBUTION_ELEMENT,
+}
+
+
+def _to_decimal(value: float | None) -> Decimal | None:
+    """Convert a float geometry value to Decimal (shortest repr)."""
+    return None if value is None else Decimal(repr(value))
+
+
+_WALL_CATEGORIES: frozenset[ElementCategory] = frozenset(
+    {ElementCategory.WALL, ElementCategory.WALL_STANDARD_CASE}
+)
+
+# Returned by the collection views of elements that have no data yet
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
 
 
 @dataclass
@@ -107,7 +210,7 @@ class MaterialLayer:
     category: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BuildingElement:
     """Building Element Domain Entity.
 
@@ -131,22 +234,25 @@ class BuildingElement:
     ifc_class: str
     category: ElementCategory
 
+    _: KW_ONLY
+
     name: str | None = None
     description: str | None = None
     object_type: str | None = None
     tag: str | None = None
 
-    # Geometry (denormalized for fast queries)
-    length_m: Decimal | None = None
-    width_m: Decimal | None = None
-    height_m: Decimal | None = None
-    area_m2: Decimal | None = None
-    volume_m3: Decimal | None = None
+    # Geometry (denormalized for fast queries). Stored as float; use the
+    # *_decimal accessors where exact decimal arithmetic is required.
+    length_m: float | None = None
+    width_m: float | None = None
+    height_m: float | None = None
+    area_m2: float | None = None
+    volume_m3: float | None = None
 
     # Position
-    position_x: Decimal | None = None
-    position_y: Decimal | None = None
-    position_z: Decimal | None = None
+    position_x: float | None = None
+    position_y: float | None = None
+    position_z: float | None = None
 
     # Spatial references
     storey_id: UUID | None = None
@@ -158,17 +264,29 @@ class BuildingElement:
     is_external: bool | None = None
     is_load_bearing: bool | None = None
 
-    # Timestamp
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    # Timestamp (assigned by the database on insert, populated on load)
+    created_at: datetime | None = None
 
-    # Lazy-loaded collections
-    _properties: dict[str, dict[str, PropertyValue]] = field(
-        default_factory=dict, repr=False
+    # Lazy-loaded collections (allocated on first write)
+    # Properties are keyed flat by (pset_name, property_name): one hash lookup
+    # per access and no inner dict per property set.
+    _properties: dict[tuple[str, str], PropertyValue] | None = field(
+        default=None, repr=False
+    )
+    _properties_view: Mapping[str, Mapping[str, PropertyValue]] | None = field(
+        default=None, repr=False
     )
-    _quantities: dict[str, dict[str, QuantityValue]] = field(
-        default_factory=dict, repr=False
+    _quantities: dict[str, dict[str, QuantityValue]] | None = field(
+        default=None, repr=False
     )
-    _materials: list[MaterialLayer] = field(default_factory=list, repr=False)
+    _materials: list[MaterialLayer] | None = field(default=None, repr=False)
+
+    # Integer form of id, used for hashing and equality
+    _id_int: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Cache the integer form of the ID."""
+        self._id_int = self.id.int
 
     @classmethod
     def create(
@@ -182,6 +300,7 @@ class BuildingElement:
         tag: str | None = None,
         storey_id: UUID | None = None,
         type_id: UUID | None = None,
+        secure_id: bool = False,
     ) -> BuildingElement:
         """Factory method to create a BuildingElement.
 
@@ -194,15 +313,17 @@ class BuildingElement:
             tag: Optional tag
             storey_id: Optional storey UUID
             type_id: Optional type UUID
+            secure_id: Use a fully random uuid4() instead of the
+                process-local fast ID
 
         Returns:
             New BuildingElement instance
         """
         if isinstance(global_id, str):
-            global_id = GlobalId(global_id)
+            global_id = _parse_global_id(global_id)
 
         return cls(
-            id=uuid4(),
+            id=uuid4() if secure_id else _fast_uuid(),
             project_id=project_id,
             global_id=global_id,
             ifc_class=ifc_class,
@@ -214,14 +335,131 @@ class BuildingElement:
             type_id=type_id,
         )
 
+    @classmethod
+    def create_many(
+        cls,
+        project_id: UUID,
+        rows: Iterable[
+            tuple[
+                str | GlobalId,
+                str,
+                str | None,
+                str | None,
+                str | None,
+                UUID | None,
+                UUID | None,
+            ]
+        ],
+    ) -> list[BuildingElement]:
+        """Create many BuildingElements for one project.
+
+        Equivalent to calling ``create`` per row, with the per-element
+        lookups hoisted out of the loop. IFC files list elements grouped
+        by class, so the category of the previous row is reused while
+        the class does not change.
+
+        Args:
+            project_id: Parent project UUID
+            rows: Tuples of (global_id, ifc_class, name, description,
+                tag, storey_id, type_id)
+
+        Returns:
+            New BuildingElement instances in row order
+        """
+        class_map = _IFC_CLASS_MAP
+        other = ElementCategory.OTHER
+        parse_gid = _parse_global_id
+        new_id = _ID_SOURCE.next_id
+
+        elements: list[BuildingElement] = []
+        last_class: str | None = None
+        last_category = other
+
+        for raw_global_id, ifc_class, name, description, tag, storey_id, type_id in rows:
+            if ifc_class != last_class:
+                last_category = class_map.get(ifc_class, other)
+                last_class = ifc_class
+            global_id = (
+                parse_gid(raw_global_id) if isinstance(raw_global_id, str) else raw_global_id
+            )
+
+            elements.append(
+                cls(
+                    id=new_id(),
+                    project_id=project_id,
+                    global_id=global_id,
+                    ifc_class=ifc_class,
+                    category=last_category,
+                    name=name,
+                    description=description,
+                    tag=tag,
+                    storey_id=storey_id,
+                    type_id=type_id,
+                )
+            )
+
+        return elements
+
+    # =========================================================================
+    # Geometry (Decimal compatibility)
+    # =========================================================================
+
+    @property
+    def length_m_decimal(self) -> Decimal | None:
+        """Get length as Decimal."""
+        return _to_decimal(self.length_m)
+
+    @property
+    def width_m_decimal(self) -> Decimal | None:
+        """Get width as Decimal."""
+        return _to_decimal(self.width_m)
+
+    @property
+    def height_m_decimal(self) -> Decimal | None:
+        """Get height as Decimal."""
+        return _to_decimal(self.height_m)
+
+    @property
+    def area_m2_decimal(self) -> Decimal | None:
+        """Get area as Decimal."""
+        return _to_decimal(self.area_m2)
+
+    @property
+    def volume_m3_decimal(self) -> Decimal | None:
+        """Get volume as Decimal."""
+        return _to_decimal(self.volume_m3)
+
+    @property
+    def position_decimal(self) -> tuple[Decimal | None, Decimal | None, Decimal | None]:
+        """Get position (x, y, z) as Decimals."""
+        return (
+            _to_decimal(self.position_x),
+            _to_decimal(self.position_y),
+            _to_decimal(self.position_z),
+        )
+
     # =========================================================================
     # Property Access
     # =========================================================================
 
     @property
-    def properties(self) -> dict[str, dict[str, PropertyValue]]:
-        """Get all property sets."""
-        return self._properties
+    def properties(self) -> Mapping[str, Mapping[str, PropertyValue]]:
+        """Get all property sets as a read-only view.
+
+        The nested pset -> property view is built on first access and
+        cached until the next ``set_property`` call. Write through
+        ``set_property``; the view rejects item assignment.
+        """
+        if self._properties is None:
+            return _EMPTY_MAPPING
+        if self._properties_view is None:
+            view: dict[str, dict[str, PropertyValue]] = {}
+            for (pset_name, property_name), prop in self._properties.items():
+                view.setdefault(pset_name, {})[property_name] = prop
+            self._properties_view = MappingProxyType(
+                {pset: MappingProxyType(props) for pset, props in view.items()}
+            )
+        return self._properties_view
 
     def get_property(
         self, pset_name: str, property_name: str
@@ -235,10 +473,9 @@ class BuildingElement:
         Returns:
             PropertyValue or None if not found
         """
-        pset = self._properties.get(pset_name)
-        if pset:
-            return pset.get(property_name)
-        return None
+        if self._properties is None:
+            return None
+        return self._properties.get((pset_name, property_name))
 
     def get_property_value(
         self, pset_name: str, property_name: str
@@ -255,6 +492,26 @@ class BuildingElement:
         prop = self.get_property(pset_name, property_name)
         return prop.value if prop else None
 
+    def get_properties_batch(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> list[Any | None]:
+        """Get raw values for several properties in one call.
+
+        Args:
+            keys: (pset_name, property_name) pairs
+
+        Returns:
+            Raw values in key order, None where not found
+        """
+        props = self._properties
+        if props is None:
+            return [None] * len(keys)
+        result: list[Any | None] = []
+        for key in keys:
+            prop = props.get(key)
+            result.append(prop.value if prop else None)
+        return result
+
     def set_property(
         self,
         pset_name: str,
@@ -272,24 +529,32 @@ class BuildingElement:
             data_type: Data type
             unit: Optional unit
         """
-        if pset_name not in self._properties:
-            self._properties[pset_name] = {}
+        if self._properties is None:
+            self._properties = {}
 
-        self._properties[pset_name][property_name] = PropertyValue(
+        self._properties[(pset_name, property_name)] = PropertyValue(
             name=property_name,
             value=value,
             data_type=data_type,
             unit=unit,
         )
+        self._properties_view = None
 
     # =========================================================================
     # Quantity Access
     # =========================================================================
 
     @property
-    def quantities(self) -> dict[str, dict[str, QuantityValue]]:
-        """Get all quantity sets."""
-        return self._quantities
+    def quantities(self) -> Mapping[str, Mapping[str, QuantityValue]]:
+        """Get all quantity sets as a read-only view.
+
+        Write through ``set_quantity``; the view rejects item assignment.
+        """
+        if self._quantities is None:
+            return _EMPTY_MAPPING
+        return MappingProxyType(
+            {qto: MappingProxyType(qtys) for qto, qtys in self._quantities.items()}
+        )
 
     def get_quantity(
         self, qto_name: str, quantity_name: str
@@ -303,6 +568,8 @@ class BuildingElement:
         Returns:
             QuantityValue or None
         """
+        if self._quantities is None:
+            return None
         qto = self._quantities.get(qto_name)
         if qto:
             return qto.get(quantity_name)
@@ -323,6 +590,27 @@ class BuildingElement:
         qty = self.get_quantity(qto_name, quantity_name)
         return qty.value if qty else None
 
+    def get_quantities_batch(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> list[Decimal | None]:
+        """Get raw values for several quantities in one call.
+
+        Args:
+            keys: (qto_name, quantity_name) pairs
+
+        Returns:
+            Decimal values in key order, None where not found
+        """
+        quantities = self._quantities
+        if quantities is None:
+            return [None] * len(keys)
+        result: list[Decimal | None] = []
+        for qto_name, quantity_name in keys:
+            qto = quantities.get(qto_name)
+            qty = qto.get(quantity_name) if qto else None
+            result.append(qty.value if qty else None)
+        return result
+
     def set_quantity(
         self,
         qto_name: str,
@@ -340,6 +628,8 @@ class BuildingElement:
             unit: Optional unit
             formula: Optional formula
         """
+        if self._quantities is None:
+            self._quantities = {}
         if qto_name not in self._quantities:
             self._quantities[qto_name] = {}
 
@@ -358,9 +648,12 @@ class BuildingElement:
     # =========================================================================
 
     @property
-    def materials(self) -> list[MaterialLayer]:
-        """Get material layers."""
-        return self._materials
+    def materials(self) -> tuple[MaterialLayer, ...]:
+        """Get material layers.
+
+        Returns a tuple snapshot; add layers with ``add_material``.
+        """
+        return tuple(self._materials) if self._materials else ()
 
     def add_material(
         self,
@@ -382,6 +675,9 @@ class BuildingElement:
         if isinstance(thickness, float):
             thickness = Decimal(str(thickness))
 
+        if self._materials is None:
+            self._materials = []
+
         self._materials.append(
             MaterialLayer(
                 material_name=material_name,
@@ -413,16 +709,7 @@ class BuildingElement:
         Returns:
             FireRating or None
         """
-        pset_names = [
-            "Pset_WallCommon",
-            "Pset_DoorCommon",
-            "Pset_WindowCommon",
-            "Pset_SlabCommon",
-            "Pset_CurtainWallCommon",
-        ]
-
-        for pset_name in pset_names:
-            value = self.get_property_value(pset_name, "FireRating")
+        for value in self.get_properties_batch(_FIRE_RATING_KEYS):
             if value:
                 return FireRating.parse(str(value))
 
@@ -431,14 +718,7 @@ class BuildingElement:
     @property
     def acoustic_rating(self) -> str | None:
         """Get acoustic rating from properties."""
-        pset_names = [
-            "Pset_WallCommon",
-            "Pset_DoorCommon",
-            "Pset_WindowCommon",
-        ]
-
-        for pset_name in pset_names:
-            value = self.get_property_value(pset_name, "AcousticRating")
+        for value in self.get_properties_batch(_ACOUSTIC_RATING_KEYS):
             if value:
                 return str(value)
 
@@ -447,15 +727,7 @@ class BuildingElement:
     @property
     def u_value(self) -> Decimal | None:
         """Get thermal transmittance (U-value) from properties."""
-        pset_names = [
-            "Pset_WallCommon",
-            "Pset_DoorCommon",
-            "Pset_WindowCommon",
-            "Pset_SlabCommon",
-        ]
-
-        for pset_name in pset_names:
-            value = self.get_property_value(pset_name, "ThermalTransmittance")
+        for value in self.get_properties_batch(_U_VALUE_KEYS):
             if value:
                 try:
                     return Decimal(str(value))
@@ -474,35 +746,23 @@ class BuildingElement:
         3. Property values
         """
         # Check materials
-        drywall_keywords = [
-            "gips", "gypsum", "drywall", "rigips", "knauf",
-            "fermacell", "plasterboard", "trockenbau",
-        ]
-
-        for material in self._materials:
-            material_lower = material.material_name.lower()
-            if any(kw in material_lower for kw in drywall_keywords):
+        for material in self._materials or ():
+            if _is_drywall_name(material.material_name):
                 return True
 
         # Check type name
-        if self.type_name:
-            type_lower = self.type_name.lower()
-            if any(kw in type_lower for kw in drywall_keywords):
-                return True
+        if self.type_name and _is_drywall_name(self.type_name):
+            return True
 
         # Check if non-load-bearing wall
-        if self.category in (ElementCategory.WALL, ElementCategory.WALL_STANDARD_CASE):
-            if self.is_load_bearing is False:
-                return True
-
-        return False
+        return self.category in _WALL_CATEGORIES and self.is_load_bearing is False
 
     def __hash__(self) -> int:
         """Hash based on ID."""
-        return hash(self.id)
+        return hash(self._id_int)
 
     def __eq__(self, other: object) -> bool:
         """Equality based on ID."""
         if isinstance(other, BuildingElement):
-            return self.id == other.id
+            return self._id_int == other._id_int
         return False
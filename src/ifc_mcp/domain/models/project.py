@@ -4,14 +4,18 @@ Represents an imported IFC project/file in the domain.
 """
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ifc_mcp.domain.models.element import BuildingElement
     from ifc_mcp.domain.models.space import Space
 
@@ -35,25 +39,46 @@ class IfcSchemaVersion(str, Enum):
         Returns:
             Matching IfcSchemaVersion enum
         """
-        normalized = value.upper().replace(" ", "").replace("_", "")
+        return _parse_schema(value)
+
+
+# Normalized schema identifiers -> version (covers nearly all real inputs)
+_SCHEMA_EXACT: dict[str, IfcSchemaVersion] = {
+    member.value: member for member in IfcSchemaVersion
+}
+
+# Fallback substring checks; order matters (IFC4X3 before IFC4)
+_SCHEMA_MARKERS: tuple[tuple[str, IfcSchemaVersion], ...] = (
+    ("IFC4X3", IfcSchemaVersion.IFC4X3),
+    ("IFC4X2", IfcSchemaVersion.IFC4X2),
+    ("IFC4X1", IfcSchemaVersion.IFC4X1),
+    ("IFC4", IfcSchemaVersion.IFC4),
+    ("IFC2", IfcSchemaVersion.IFC2X3),
+)
+
+# Deletes spaces and underscores in one pass
+_STRIP = str.maketrans("", "", " _")
+
+
+@lru_cache(maxsize=64)
+def _parse_schema(value: str) -> IfcSchemaVersion:
+    """Parse schema version string (cached; inputs come from a small set)."""
+    normalized = value.upper().translate(_STRIP)
+
+    exact = _SCHEMA_EXACT.get(normalized)
+    if exact is not None:
+        return exact
 
-        # Handle common variations
-        if "IFC4X3" in normalized:
-            return cls.IFC4X3
-        if "IFC4X2" in normalized:
-            return cls.IFC4X2
-        if "IFC4X1" in normalized:
-            return cls.IFC4X1
-        if "IFC4" in normalized:
-            return cls.IFC4
-        if "IFC2X3" in normalized or "IFC2" in normalized:
-            return cls.IFC2X3
+    # Handle common variations (e.g., "IFC2X3 TC1", "IFC4 ADD2")
+    for marker, version in _SCHEMA_MARKERS:
+        if marker in normalized:
+            return version
 
-        # Default to IFC4 for unknown
-        return cls.IFC4
+    # Default to IFC4 for unknown
+    return IfcSchemaVersion.IFC4
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Storey:
     """Building storey/floor level.
 
@@ -72,7 +97,7 @@ class Storey:
     name: str | None = None
     long_name: str | None = None
     elevation: float | None = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=partial(datetime.now, UTC))
 
     @classmethod
     def create(
@@ -104,8 +129,22 @@ class Storey:
             elevation=elevation,
         )
 
+    # =========================================================================
+    # Equality
+    # =========================================================================
 
-@dataclass
+    def __hash__(self) -> int:
+        """Hash based on ID."""
+        return hash(self.id.int)
+
+    def __eq__(self, other: object) -> bool:
+        """Equality based on ID."""
+        if isinstance(other, Storey):
+            return self.id == other.id
+        return False
+
+
+@dataclass(slots=True, eq=False)
 class Project:
     """IFC Project Aggregate Root.
 
@@ -119,7 +158,7 @@ class Project:
         description: Project description
         schema_version: IFC schema version
         original_file_path: Path to original IFC file
-        original_file_hash: SHA-256 hash for deduplication
+        original_file_hash: SHA-256 digest for deduplication
         authoring_app: Application that created the IFC
         author: Author name
         organization: Organization name
@@ -132,19 +171,35 @@ class Project:
     schema_version: IfcSchemaVersion
     description: str | None = None
     original_file_path: str | None = None
-    original_file_hash: str | None = None
+    original_file_hash: bytes | None = None
     authoring_app: str | None = None
     author: str | None = None
     organization: str | None = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
-    imported_at: datetime = field(default_factory=datetime.utcnow)
+    # Set together from one clock read in ``create``, or loaded from storage
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    imported_at: datetime | None = None
     deleted_at: datetime | None = None
 
     # Aggregate children (loaded lazily)
-    _storeys: list[Storey] = field(default_factory=list, repr=False)
-    _element_count: int | None = field(default=None, repr=False)
-    _space_count: int | None = field(default=None, repr=False)
+    storeys: list[Storey] = field(default_factory=list, repr=False)
+    element_count: int | None = field(default=None, repr=False)
+    space_count: int | None = field(default=None, repr=False)
+
+    # Storey lookup indexes, rebuilt when ``storeys`` changes
+    _storey_by_name: dict[str, Storey] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _storey_elevations: list[float] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _storeys_by_elevation: list[Storey] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _indexed_storeys: list[Storey] | None = field(
+        default=None, init=False, repr=False
+    )
+    _indexed_count: int = field(default=0, init=False, repr=False)
 
     @classmethod
     def create(
@@ -154,7 +209,7 @@ class Project:
         *,
         description: str | None = None,
         original_file_path: str | None = None,
-        original_file_hash: str | None = None,
+        original_file_hash: bytes | None = None,
         authoring_app: str | None = None,
         author: str | None = None,
         organization: str | None = None,
@@ -177,10 +232,14 @@ class Project:
         if isinstance(schema_version, str):
             schema_version = IfcSchemaVersion.from_string(schema_version)
 
+        now = datetime.now(UTC)
         return cls(
             id=uuid4(),
             name=name,
             schema_version=schema_version,
+            created_at=now,
+            updated_at=now,
+            imported_at=now,
             description=description,
             original_file_path=original_file_path,
             original_file_hash=original_file_hash,
@@ -189,36 +248,6 @@ class Project:
             organization=organization,
         )
 
-    @property
-    def storeys(self) -> list[Storey]:
-        """Get project storeys."""
-        return self._storeys
-
-    @storeys.setter
-    def storeys(self, value: list[Storey]) -> None:
-        """Set project storeys."""
-        self._storeys = value
-
-    @property
-    def element_count(self) -> int | None:
-        """Get total element count (if loaded)."""
-        return self._element_count
-
-    @element_count.setter
-    def element_count(self, value: int) -> None:
-        """Set element count."""
-        self._element_count = value
-
-    @property
-    def space_count(self) -> int | None:
-        """Get total space count (if loaded)."""
-        return self._space_count
-
-    @space_count.setter
-    def space_count(self, value: int) -> None:
-        """Set space count."""
-        self._space_count = value
-
     @property
     def is_deleted(self) -> bool:
         """Check if project is soft-deleted."""
@@ -231,7 +260,22 @@ class Project:
             storey: Storey to add
         """
         storey.project_id = self.id
-        self._storeys.append(storey)
+        indexed = self._is_storey_index_current()
+        self.storeys.append(storey)
+        if indexed:
+            self._index_storey(storey)
+            self._indexed_count += 1
+
+    def load_storeys(self, storeys: Iterable[Storey]) -> None:
+        """Replace the project's storeys in one step.
+
+        Intended for bulk loading; builds the list once instead of
+        appending storey by storey.
+
+        Args:
+            storeys: Storeys belonging to this project
+        """
+        self.storeys = list(storeys)
 
     def get_storey_by_name(self, name: str) -> Storey | None:
         """Find storey by name.
@@ -242,10 +286,8 @@ class Project:
         Returns:
             Matching Storey or None
         """
-        for storey in self._storeys:
-            if storey.name == name:
-                return storey
-        return None
+        self._ensure_storey_index()
+        return self._storey_by_name.get(name)
 
     def get_storey_by_elevation(self, elevation: float, tolerance: float = 0.01) -> Storey | None:
         """Find storey by elevation.
@@ -255,17 +297,55 @@ class Project:
             tolerance: Matching tolerance
 
         Returns:
-            Matching Storey or None
+            Nearest storey within tolerance, or None
         """
-        for storey in self._storeys:
-            if storey.elevation is not None:
-                if abs(storey.elevation - elevation) <= tolerance:
-                    return storey
-        return None
+        self._ensure_storey_index()
+        elevations = self._storey_elevations
+        pos = bisect_left(elevations, elevation)
+
+        best: Storey | None = None
+        best_delta = tolerance
+        for candidate in (pos - 1, pos):
+            if 0 <= candidate < len(elevations):
+                delta = abs(elevations[candidate] - elevation)
+                if delta <= best_delta:
+                    best = self._storeys_by_elevation[candidate]
+                    best_delta = delta
+        return best
+
+    def _is_storey_index_current(self) -> bool:
+        """Check whether the lookup indexes reflect ``storeys``."""
+        return (
+            self._indexed_storeys is self.storeys
+            and self._indexed_count == len(self.storeys)
+        )
+
+    def _ensure_storey_index(self) -> None:
+        """Rebuild the storey lookup indexes if ``storeys`` changed."""
+        if self._is_storey_index_current():
+            return
+
+        self._storey_by_name = {}
+        self._storey_elevations = []
+        self._storeys_by_elevation = []
+        for storey in self.storeys:
+            self._index_storey(storey)
+
+        self._indexed_storeys = self.storeys
+        self._indexed_count = len(self.storeys)
+
+    def _index_storey(self, storey: Storey) -> None:
+        """Add a single storey to the lookup indexes."""
+        if storey.name is not None:
+            self._storey_by_name.setdefault(storey.name, storey)
+        if storey.elevation is not None:
+            pos = bisect_right(self._storey_elevations, storey.elevation)
+            self._storey_elevations.insert(pos, storey.elevation)
+            self._storeys_by_elevation.insert(pos, storey)
 
     def mark_deleted(self) -> None:
         """Soft-delete the project."""
-        self.deleted_at = datetime.utcnow()
+        self.deleted_at = datetime.now(UTC)
 
     def restore(self) -> None:
         """Restore a soft-deleted project."""
@@ -273,4 +353,18 @@ class Project:
 
     def touch(self) -> None:
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(UTC)
+
+    # =========================================================================
+    # Equality
+    # =========================================================================
+
+    def __hash__(self) -> int:
+        """Hash based on ID."""
+        return hash(self.id.int)
+
+    def __eq__(self, other: object) -> bool:
+        """Equality based on ID."""
+        if isinstance(other, Project):
+            return self.id == other.id
+        return False
@@ -4,15 +4,56 @@ Represents a room/space from IFC with specialized attributes.
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
-from decimal import Decimal
+from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from ifc_mcp.domain.value_objects import ExZone, ExZoneType, GlobalId
+from ifc_mcp.domain.value_objects import ExZone, GlobalId
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import datetime
+    from decimal import Decimal
+
+
+# Shared default for non-hazardous spaces (ExZone is frozen)
+_EX_ZONE_NONE = ExZone.none()
+
+# Boundary class buckets (bit flags)
+_WALL = 1
+_DOOR = 2
+_WINDOW = 4
+
+# IFC class -> bucket flags. Seeded with the common classes and extended
+# on first sight of any other class, so classification is one dict lookup.
+_IFC_CLASS_BUCKET: dict[str, int] = {
+    "IfcWall": _WALL,
+    "IfcWallStandardCase": _WALL,
+    "IfcWallElementedCase": _WALL,
+    "IfcCurtainWall": _WALL,
+    "IfcDoor": _DOOR,
+    "IfcDoorStandardCase": _DOOR,
+    "IfcWindow": _WINDOW,
+    "IfcWindowStandardCase": _WINDOW,
+}
+
+
+def _boundary_bucket(element_class: str) -> int:
+    """Get bucket flags for an IFC class name."""
+    bucket = _IFC_CLASS_BUCKET.get(element_class)
+    if bucket is None:
+        bucket = (
+            (_WALL if "Wall" in element_class else 0)
+            | (_DOOR if "Door" in element_class else 0)
+            | (_WINDOW if "Window" in element_class else 0)
+        )
+        _IFC_CLASS_BUCKET[sys.intern(element_class)] = bucket
+    return bucket
 
 
-@dataclass
+@dataclass(slots=True)
 class SpaceBoundary:
     """Space boundary - element that bounds a space."""
 
@@ -23,8 +64,26 @@ class SpaceBoundary:
     physical_or_virtual: str | None = None  # "PHYSICAL", "VIRTUAL"
     internal_or_external: str | None = None  # "INTERNAL", "EXTERNAL"
 
+    def __post_init__(self) -> None:
+        """Intern the enumerated string fields.
+
+        These come from tiny fixed vocabularies, so interning keeps one
+        string object per distinct value across all boundaries.
+        """
+        if self.boundary_type:
+            self.boundary_type = sys.intern(self.boundary_type)
+        if self.physical_or_virtual:
+            self.physical_or_virtual = sys.intern(self.physical_or_virtual)
+        if self.internal_or_external:
+            self.internal_or_external = sys.intern(self.internal_or_external)
+
 
-@dataclass
+_BoundaryBuckets = tuple[
+    list[SpaceBoundary], list[SpaceBoundary], list[SpaceBoundary]
+]
+
+
+@dataclass(slots=True, eq=False)
 class Space:
     """Space/Room Domain Entity.
 
@@ -65,7 +124,7 @@ class Space:
     occupancy_type: str | None = None
 
     # Explosion Protection
-    ex_zone: ExZone = field(default_factory=ExZone.none)
+    ex_zone: ExZone = _EX_ZONE_NONE
     hazardous_area: bool = False
 
     # Fire Safety
@@ -76,12 +135,21 @@ class Space:
     finish_wall: str | None = None
     finish_ceiling: str | None = None
 
-    # Timestamp
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    # Timestamp (set by the database on insert)
+    created_at: datetime | None = None
 
     # Relationships (lazy loaded)
-    _boundaries: list[SpaceBoundary] = field(default_factory=list, repr=False)
-    _adjacent_spaces: list[UUID] = field(default_factory=list, repr=False)
+    boundaries: list[SpaceBoundary] = field(default_factory=list, repr=False)
+    adjacent_spaces: list[UUID] = field(default_factory=list, repr=False)
+
+    # (walls, doors, windows) buckets, built on first use and rebuilt
+    # when ``boundaries`` changes
+    _buckets: _BoundaryBuckets | None = field(default=None, init=False, repr=False)
+    _external_count: int = field(default=0, init=False, repr=False)
+    _indexed_boundaries: list[SpaceBoundary] | None = field(
+        default=None, init=False, repr=False
+    )
+    _indexed_count: int = field(default=0, init=False, repr=False)
 
     @classmethod
     def create(
@@ -144,26 +212,6 @@ class Space:
         """Get primary volume (net preferred)."""
         return self.net_volume or self.gross_volume
 
-    @property
-    def boundaries(self) -> list[SpaceBoundary]:
-        """Get space boundaries."""
-        return self._boundaries
-
-    @boundaries.setter
-    def boundaries(self, value: list[SpaceBoundary]) -> None:
-        """Set space boundaries."""
-        self._boundaries = value
-
-    @property
-    def adjacent_spaces(self) -> list[UUID]:
-        """Get adjacent space IDs."""
-        return self._adjacent_spaces
-
-    @adjacent_spaces.setter
-    def adjacent_spaces(self, value: list[UUID]) -> None:
-        """Set adjacent space IDs."""
-        self._adjacent_spaces = value
-
     # =========================================================================
     # Ex-Zone Methods
     # =========================================================================
@@ -175,10 +223,10 @@ class Space:
             zone: ExZone, zone string, or None
         """
         if zone is None:
-            self.ex_zone = ExZone.none()
+            self.ex_zone = _EX_ZONE_NONE
         elif isinstance(zone, str):
             parsed = ExZone.parse(zone)
-            self.ex_zone = parsed if parsed else ExZone.none()
+            self.ex_zone = parsed if parsed else _EX_ZONE_NONE
         else:
             self.ex_zone = zone
 
@@ -218,73 +266,137 @@ class Space:
             physical_or_virtual: Physical or virtual boundary
             internal_or_external: Internal or external boundary
         """
-        self._boundaries.append(
-            SpaceBoundary(
-                element_id=element_id,
-                element_name=element_name,
-                element_class=element_class,
-                boundary_type=boundary_type,
-                physical_or_virtual=physical_or_virtual,
-                internal_or_external=internal_or_external,
-            )
+        boundary = SpaceBoundary(
+            element_id=element_id,
+            element_name=element_name,
+            element_class=element_class,
+            boundary_type=boundary_type,
+            physical_or_virtual=physical_or_virtual,
+            internal_or_external=internal_or_external,
         )
+        buckets = self._buckets if self._is_boundary_index_current() else None
+        self.boundaries.append(boundary)
+        if buckets is not None:
+            self._index_boundary(boundary, buckets)
+            self._indexed_count += 1
+
+    def load_boundaries(self, boundaries: Iterable[SpaceBoundary]) -> None:
+        """Replace the space's boundaries in one step.
+
+        Intended for bulk loading; builds the list once instead of
+        calling ``add_boundary`` per element.
+
+        Args:
+            boundaries: Boundaries of this space
+        """
+        self.boundaries = list(boundaries)
 
     def get_boundary_walls(self) -> list[SpaceBoundary]:
         """Get wall boundaries.
 
         Returns:
-            List of wall boundaries
+            New list of wall boundaries
         """
-        return [
-            b for b in self._boundaries
-            if b.element_class and "Wall" in b.element_class
-        ]
+        return list(self._ensure_boundary_index()[0])
 
     def get_boundary_doors(self) -> list[SpaceBoundary]:
         """Get door boundaries.
 
         Returns:
-            List of door boundaries
+            New list of door boundaries
         """
-        return [
-            b for b in self._boundaries
-            if b.element_class and "Door" in b.element_class
-        ]
+        return list(self._ensure_boundary_index()[1])
 
     def get_boundary_windows(self) -> list[SpaceBoundary]:
         """Get window boundaries.
 
         Returns:
-            List of window boundaries
+            New list of window boundaries
         """
-        return [
-            b for b in self._boundaries
-            if b.element_class and "Window" in b.element_class
-        ]
+        return list(self._ensure_boundary_index()[2])
+
+    def iter_boundary_walls(self) -> Iterator[SpaceBoundary]:
+        """Iterate wall boundaries without building a list."""
+        return iter(self._ensure_boundary_index()[0])
+
+    def iter_boundary_doors(self) -> Iterator[SpaceBoundary]:
+        """Iterate door boundaries without building a list."""
+        return iter(self._ensure_boundary_index()[1])
+
+    def iter_boundary_windows(self) -> Iterator[SpaceBoundary]:
+        """Iterate window boundaries without building a list."""
+        return iter(self._ensure_boundary_index()[2])
+
+    def categorize_boundaries(self) -> _BoundaryBuckets:
+        """Get wall, door and window boundaries together.
+
+        Returns:
+            Tuple of new (walls, doors, windows) lists
+        """
+        walls, doors, windows = self._ensure_boundary_index()
+        return list(walls), list(doors), list(windows)
 
     @property
     def external_boundary_count(self) -> int:
         """Count external boundaries."""
-        return sum(
-            1 for b in self._boundaries
-            if b.internal_or_external == "EXTERNAL"
+        self._ensure_boundary_index()
+        return self._external_count
+
+    def _is_boundary_index_current(self) -> bool:
+        """Check whether the boundary buckets reflect ``boundaries``."""
+        return (
+            self._indexed_boundaries is self.boundaries
+            and self._indexed_count == len(self.boundaries)
         )
 
+    def _ensure_boundary_index(self) -> _BoundaryBuckets:
+        """Get the boundary buckets, rebuilding them if ``boundaries`` changed."""
+        buckets = self._buckets
+        if buckets is not None and self._is_boundary_index_current():
+            return buckets
+
+        buckets = ([], [], [])
+        self._external_count = 0
+        for boundary in self.boundaries:
+            self._index_boundary(boundary, buckets)
+
+        self._buckets = buckets
+        self._indexed_boundaries = self.boundaries
+        self._indexed_count = len(self.boundaries)
+        return buckets
+
+    def _index_boundary(
+        self, boundary: SpaceBoundary, buckets: _BoundaryBuckets
+    ) -> None:
+        """Add a single boundary to the class buckets."""
+        if boundary.element_class:
+            bucket = _boundary_bucket(boundary.element_class)
+            if bucket & _WALL:
+                buckets[0].append(boundary)
+            if bucket & _DOOR:
+                buckets[1].append(boundary)
+            if bucket & _WINDOW:
+                buckets[2].append(boundary)
+        if boundary.internal_or_external == "EXTERNAL":
+            self._external_count += 1
+
     @property
     def has_external_boundaries(self) -> bool:
         """Check if space has external boundaries."""
-        return self.external_boundary_count > 0
+        self._ensure_boundary_index()
+        return self._external_count > 0
 
     # =========================================================================
     # Volume Analysis (for Ex-Protection)
     # =========================================================================
 
     def calculate_ventilation_ratio(
-        self, opening_area_m2: Decimal
-    ) -> Decimal | None:
+        self, opening_area_m2: float | Decimal
+    ) -> float | None:
         """Calculate opening area to floor area ratio.
 
         Important for explosion protection ventilation requirements.
+        Computed in float; the ratio does not need decimal exactness.
 
         Args:
             opening_area_m2: Total opening area in m\u00b2
@@ -292,14 +404,18 @@ class Space:
         Returns:
             Ratio (opening_area / floor_area) or None
         """
-        if self.net_floor_area and self.net_floor_area > 0:
-            return opening_area_m2 / self.net_floor_area
+        floor_area = self.net_floor_area
+        if floor_area is None:
+            return None
+        floor_area_f = float(floor_area)
+        if floor_area_f > 0:
+            return float(opening_area_m2) / floor_area_f
         return None
 
     def estimate_air_changes_per_hour(
         self,
-        ventilation_rate_m3_per_hour: Decimal,
-    ) -> Decimal | None:
+        ventilation_rate_m3_per_hour: float | Decimal,
+    ) -> float | None:
         """Estimate air changes per hour.
 
         Args:
@@ -308,8 +424,12 @@ class Space:
         Returns:
             Air changes per hour or None
         """
-        if self.net_volume and self.net_volume > 0:
-            return ventilation_rate_m3_per_hour / self.net_volume
+        volume = self.net_volume
+        if volume is None:
+            return None
+        volume_f = float(volume)
+        if volume_f > 0:
+            return float(ventilation_rate_m3_per_hour) / volume_f
         return None
 
     # =========================================================================
@@ -322,6 +442,6 @@ class Space:
 
     def __eq__(self, other: object) -> bool:
         """Equality based on ID."""
-        if isinstance(other, Space):
+        if type(other) is Space:
             return self.id == other.id
         return False
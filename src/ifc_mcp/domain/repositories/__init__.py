@@ -4,7 +4,7 @@ Defines the contracts for data access without implementation details.
 """
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol
 from uuid import UUID
 
 from ifc_mcp.domain.models import (
@@ -16,7 +16,12 @@ from ifc_mcp.domain.models import (
 )
 
 
-@runtime_checkable
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from ifc_mcp.domain.value_objects import ExZoneType
+
+
 class IProjectRepository(Protocol):
     """Repository interface for Project aggregate."""
 
@@ -31,11 +36,11 @@ class IProjectRepository(Protocol):
         """
         ...
 
-    async def get_by_file_hash(self, file_hash: str) -> Project | None:
+    async def get_by_file_hash(self, file_hash: bytes) -> Project | None:
         """Get project by file hash (for deduplication).
 
         Args:
-            file_hash: SHA-256 hash of original file
+            file_hash: SHA-256 digest of original file
 
         Returns:
             Project or None
@@ -107,7 +112,6 @@ class IProjectRepository(Protocol):
         ...
 
 
-@runtime_checkable
 class IStoreyRepository(Protocol):
     """Repository interface for Storey entities."""
 
@@ -128,7 +132,6 @@ class IStoreyRepository(Protocol):
         ...
 
 
-@runtime_checkable
 class IElementRepository(Protocol):
     """Repository interface for BuildingElement entities."""
 
@@ -143,6 +146,23 @@ class IElementRepository(Protocol):
         """
         ...
 
+    async def get_many_by_ids(
+        self,
+        element_ids: Sequence[UUID],
+    ) -> dict[UUID, BuildingElement]:
+        """Get several elements by ID in one query.
+
+        Prefer this over repeated ``get_by_id`` calls when resolving
+        references (e.g. space boundary elements).
+
+        Args:
+            element_ids: Element UUIDs
+
+        Returns:
+            Mapping of ID to element; unknown IDs are omitted
+        """
+        ...
+
     async def get_by_global_id(
         self,
         project_id: UUID,
@@ -184,6 +204,36 @@ class IElementRepository(Protocol):
         """
         ...
 
+    def iter_by_project(
+        self,
+        project_id: UUID,
+        *,
+        ifc_class: str | None = None,
+        category: ElementCategory | None = None,
+        storey_id: UUID | None = None,
+        is_external: bool | None = None,
+        is_load_bearing: bool | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[BuildingElement]:
+        """Stream all elements matching the criteria.
+
+        Unlike ``find_by_project`` this is unpaginated and yields elements
+        as rows arrive, so large projects need not fit in memory at once.
+
+        Args:
+            project_id: Project UUID
+            ifc_class: Filter by IFC class
+            category: Filter by category
+            storey_id: Filter by storey
+            is_external: Filter by external flag
+            is_load_bearing: Filter by load-bearing flag
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            Async iterator of elements
+        """
+        ...
+
     async def find_by_property(
         self,
         project_id: UUID,
@@ -204,6 +254,25 @@ class IElementRepository(Protocol):
         """
         ...
 
+    async def find_by_properties(
+        self,
+        project_id: UUID,
+        filters: Sequence[tuple[str, str, str]],
+        *,
+        match_all: bool = True,
+    ) -> list[BuildingElement]:
+        """Find elements matching several property values in one query.
+
+        Args:
+            project_id: Project UUID
+            filters: (pset_name, property_name, property_value) triples
+            match_all: Require all filters (AND) instead of any (OR)
+
+        Returns:
+            List of matching elements
+        """
+        ...
+
     async def find_by_material(
         self,
         project_id: UUID,
@@ -231,11 +300,20 @@ class IElementRepository(Protocol):
         """
         ...
 
-    async def add_batch(self, elements: list[BuildingElement]) -> int:
+    async def add_batch(
+        self,
+        elements: list[BuildingElement],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
         """Batch add elements for import performance.
 
+        Implementations should write each chunk as one multi-row
+        statement (or COPY) rather than one INSERT per element.
+
         Args:
             elements: Elements to add
+            chunk_size: Maximum elements written per statement
 
         Returns:
             Count of added elements
@@ -284,7 +362,6 @@ class IElementRepository(Protocol):
         ...
 
 
-@runtime_checkable
 class ISpaceRepository(Protocol):
     """Repository interface for Space entities."""
 
@@ -292,6 +369,14 @@ class ISpaceRepository(Protocol):
         """Get space by ID with boundaries loaded."""
         ...
 
+    async def get_many_by_ids(self, space_ids: Sequence[UUID]) -> dict[UUID, Space]:
+        """Get several spaces by ID in one query, boundaries loaded.
+
+        Prefer this over repeated ``get_by_id`` calls when traversing
+        adjacent spaces.
+        """
+        ...
+
     async def get_by_global_id(
         self,
         project_id: UUID,
@@ -323,6 +408,31 @@ class ISpaceRepository(Protocol):
         """
         ...
 
+    def iter_by_project(
+        self,
+        project_id: UUID,
+        *,
+        storey_id: UUID | None = None,
+        ex_zone_only: bool = False,
+        hazardous_only: bool = False,
+        fire_compartment: str | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Space]:
+        """Stream all spaces matching the criteria (unpaginated).
+
+        Args:
+            project_id: Project UUID
+            storey_id: Filter by storey
+            ex_zone_only: Only return spaces with Ex-Zone
+            hazardous_only: Only return hazardous areas
+            fire_compartment: Filter by fire compartment
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            Async iterator of spaces
+        """
+        ...
+
     async def find_by_ex_zone(
         self,
         project_id: UUID,
@@ -343,8 +453,8 @@ class ISpaceRepository(Protocol):
         """Add a space."""
         ...
 
-    async def add_batch(self, spaces: list[Space]) -> int:
-        """Batch add spaces."""
+    async def add_batch(self, spaces: list[Space], *, chunk_size: int = 1000) -> int:
+        """Batch add spaces, written in chunks of ``chunk_size``."""
         ...
 
     async def update(self, space: Space) -> Space:
@@ -360,13 +470,22 @@ class ISpaceRepository(Protocol):
         """Count spaces."""
         ...
 
+    async def count_by_ex_zone(self, project_id: UUID) -> dict[ExZoneType, int]:
+        """Count spaces per Ex-Zone in one query, zero-filled for all zones."""
+        ...
+
 
-@runtime_checkable
 class IUnitOfWork(Protocol):
     """Unit of Work pattern for transaction management.
 
     Coordinates the work of multiple repositories within a single
     database transaction.
+
+    Within one transaction, storeys and spaces loaded through any
+    repository method are the same instance for the same ID, and
+    ``get_by_id`` returns it without another query. Updates and deletes
+    evict the affected entries; the identity map is cleared on commit and
+    rollback.
     """
 
     projects: IProjectRepository
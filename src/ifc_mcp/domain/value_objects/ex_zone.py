@@ -5,9 +5,9 @@ Represents ATEX explosion protection zone classifications.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar
+from functools import lru_cache
 
 
 class ExZoneType(str, Enum):
@@ -41,6 +41,57 @@ class ExplosionType(str, Enum):
     NONE = "none"
 
 
+_ZONE_NUMBER_RE = re.compile(r"\d{1,2}")
+
+# Per-zone classification tables
+_EXPLOSION_TYPE: dict[ExZoneType, ExplosionType] = {
+    ExZoneType.ZONE_0: ExplosionType.GAS,
+    ExZoneType.ZONE_1: ExplosionType.GAS,
+    ExZoneType.ZONE_2: ExplosionType.GAS,
+    ExZoneType.ZONE_20: ExplosionType.DUST,
+    ExZoneType.ZONE_21: ExplosionType.DUST,
+    ExZoneType.ZONE_22: ExplosionType.DUST,
+    ExZoneType.NONE: ExplosionType.NONE,
+}
+
+_HAZARD_LEVEL: dict[ExZoneType, int] = {
+    ExZoneType.ZONE_0: 0,
+    ExZoneType.ZONE_20: 0,
+    ExZoneType.ZONE_1: 1,
+    ExZoneType.ZONE_21: 1,
+    ExZoneType.ZONE_2: 2,
+    ExZoneType.ZONE_22: 2,
+    ExZoneType.NONE: 3,
+}
+
+_EQUIPMENT_CATEGORY: dict[ExZoneType, int] = {
+    ExZoneType.ZONE_0: 1,
+    ExZoneType.ZONE_20: 1,
+    ExZoneType.ZONE_1: 2,
+    ExZoneType.ZONE_21: 2,
+    ExZoneType.ZONE_2: 3,
+    ExZoneType.ZONE_22: 3,
+}
+
+_DURATION_HOURS: dict[ExZoneType, tuple[int, int]] = {
+    ExZoneType.ZONE_0: (1000, 8760),  # >1000 h/year
+    ExZoneType.ZONE_20: (1000, 8760),
+    ExZoneType.ZONE_1: (10, 1000),  # 10-1000 h/year
+    ExZoneType.ZONE_21: (10, 1000),
+    ExZoneType.ZONE_2: (0, 10),  # <10 h/year
+    ExZoneType.ZONE_22: (0, 10),
+}
+
+_LABEL: dict[ExZoneType, str] = {
+    zone_type: (
+        "No Ex-Zone"
+        if zone_type is ExZoneType.NONE
+        else f"Zone {zone_type.value.replace('zone_', '')}"
+    )
+    for zone_type in ExZoneType
+}
+
+
 @dataclass(frozen=True, slots=True)
 class ExZone:
     """Value Object for ATEX Explosion Zone Classification.
@@ -63,34 +114,11 @@ class ExZone:
     """
 
     zone_type: ExZoneType
+    _hash: int = field(init=False, repr=False, compare=False)
 
-    # Parse patterns for zone identification
-    _ZONE_PATTERNS: ClassVar[dict[str, ExZoneType]] = {
-        "0": ExZoneType.ZONE_0,
-        "1": ExZoneType.ZONE_1,
-        "2": ExZoneType.ZONE_2,
-        "20": ExZoneType.ZONE_20,
-        "21": ExZoneType.ZONE_21,
-        "22": ExZoneType.ZONE_22,
-        "zone 0": ExZoneType.ZONE_0,
-        "zone 1": ExZoneType.ZONE_1,
-        "zone 2": ExZoneType.ZONE_2,
-        "zone 20": ExZoneType.ZONE_20,
-        "zone 21": ExZoneType.ZONE_21,
-        "zone 22": ExZoneType.ZONE_22,
-        "zone_0": ExZoneType.ZONE_0,
-        "zone_1": ExZoneType.ZONE_1,
-        "zone_2": ExZoneType.ZONE_2,
-        "zone_20": ExZoneType.ZONE_20,
-        "zone_21": ExZoneType.ZONE_21,
-        "zone_22": ExZoneType.ZONE_22,
-        "ex-zone 0": ExZoneType.ZONE_0,
-        "ex-zone 1": ExZoneType.ZONE_1,
-        "ex-zone 2": ExZoneType.ZONE_2,
-        "ex zone 0": ExZoneType.ZONE_0,
-        "ex zone 1": ExZoneType.ZONE_1,
-        "ex zone 2": ExZoneType.ZONE_2,
-    }
+    def __post_init__(self) -> None:
+        """Precompute the hash; the zone type never changes."""
+        object.__setattr__(self, "_hash", hash(self.zone_type))
 
     @classmethod
     def parse(cls, value: str | None) -> ExZone | None:
@@ -104,25 +132,11 @@ class ExZone:
         """
         if not value:
             return None
-
-        normalized = value.strip().lower()
-
-        # Direct lookup
-        if normalized in cls._ZONE_PATTERNS:
-            return cls(zone_type=cls._ZONE_PATTERNS[normalized])
-
-        # Try regex for patterns like "Zone: 1" or "Ex-Zone: 2"
-        match = re.search(r"(\d{1,2})", normalized)
-        if match:
-            zone_num = match.group(1)
-            if zone_num in cls._ZONE_PATTERNS:
-                return cls(zone_type=cls._ZONE_PATTERNS[zone_num])
-
-        return None
+        return _parse_ex_zone(value)
 
     @classmethod
     def from_type(cls, zone_type: ExZoneType) -> ExZone:
-        """Create ExZone from ExZoneType enum.
+        """Get the shared ExZone for an ExZoneType enum.
 
         Args:
             zone_type: Zone type enum value
@@ -130,16 +144,16 @@ class ExZone:
         Returns:
             ExZone instance
         """
-        return cls(zone_type=zone_type)
+        return _INSTANCES[zone_type]
 
     @classmethod
     def none(cls) -> ExZone:
-        """Create non-hazardous zone.
+        """Get the shared non-hazardous zone.
 
         Returns:
             ExZone with NONE classification
         """
-        return cls(zone_type=ExZoneType.NONE)
+        return _INSTANCES[ExZoneType.NONE]
 
     @property
     def is_hazardous(self) -> bool:
@@ -157,11 +171,7 @@ class ExZone:
         Returns:
             True for Zones 0, 1, 2
         """
-        return self.zone_type in (
-            ExZoneType.ZONE_0,
-            ExZoneType.ZONE_1,
-            ExZoneType.ZONE_2,
-        )
+        return _EXPLOSION_TYPE[self.zone_type] is ExplosionType.GAS
 
     @property
     def is_dust_zone(self) -> bool:
@@ -170,11 +180,7 @@ class ExZone:
         Returns:
             True for Zones 20, 21, 22
         """
-        return self.zone_type in (
-            ExZoneType.ZONE_20,
-            ExZoneType.ZONE_21,
-            ExZoneType.ZONE_22,
-        )
+        return _EXPLOSION_TYPE[self.zone_type] is ExplosionType.DUST
 
     @property
     def explosion_type(self) -> ExplosionType:
@@ -183,11 +189,7 @@ class ExZone:
         Returns:
             Gas, Dust, or None
         """
-        if self.is_gas_zone:
-            return ExplosionType.GAS
-        if self.is_dust_zone:
-            return ExplosionType.DUST
-        return ExplosionType.NONE
+        return _EXPLOSION_TYPE[self.zone_type]
 
     @property
     def hazard_level(self) -> int:
@@ -199,16 +201,7 @@ class ExZone:
             2 for Zone 2/22
             3 for non-hazardous
         """
-        mapping = {
-            ExZoneType.ZONE_0: 0,
-            ExZoneType.ZONE_20: 0,
-            ExZoneType.ZONE_1: 1,
-            ExZoneType.ZONE_21: 1,
-            ExZoneType.ZONE_2: 2,
-            ExZoneType.ZONE_22: 2,
-            ExZoneType.NONE: 3,
-        }
-        return mapping[self.zone_type]
+        return _HAZARD_LEVEL[self.zone_type]
 
     @property
     def required_equipment_category(self) -> int | None:
@@ -220,18 +213,7 @@ class ExZone:
             3 for Zone 2/22 (Category 3 equipment required)
             None for non-hazardous
         """
-        if not self.is_hazardous:
-            return None
-
-        mapping = {
-            ExZoneType.ZONE_0: 1,
-            ExZoneType.ZONE_20: 1,
-            ExZoneType.ZONE_1: 2,
-            ExZoneType.ZONE_21: 2,
-            ExZoneType.ZONE_2: 3,
-            ExZoneType.ZONE_22: 3,
-        }
-        return mapping.get(self.zone_type)
+        return _EQUIPMENT_CATEGORY.get(self.zone_type)
 
     @property
     def typical_duration_hours_per_year(self) -> tuple[int, int] | None:
@@ -240,21 +222,11 @@ class ExZone:
         Returns:
             Tuple of (min_hours, max_hours) per year, or None for non-hazardous
         """
-        durations = {
-            ExZoneType.ZONE_0: (1000, 8760),  # >1000 h/year
-            ExZoneType.ZONE_20: (1000, 8760),
-            ExZoneType.ZONE_1: (10, 1000),  # 10-1000 h/year
-            ExZoneType.ZONE_21: (10, 1000),
-            ExZoneType.ZONE_2: (0, 10),  # <10 h/year
-            ExZoneType.ZONE_22: (0, 10),
-        }
-        return durations.get(self.zone_type)
+        return _DURATION_HOURS.get(self.zone_type)
 
     def __str__(self) -> str:
         """Return string representation."""
-        if self.zone_type == ExZoneType.NONE:
-            return "No Ex-Zone"
-        return f"Zone {self.zone_type.value.replace('zone_', '')}"
+        return _LABEL[self.zone_type]
 
     def __repr__(self) -> str:
         """Return debug representation."""
@@ -262,13 +234,23 @@ class ExZone:
 
     def __eq__(self, other: object) -> bool:
         """Check equality."""
-        if isinstance(other, ExZone):
+        if other is self:
+            return True
+        if type(other) is ExZone:
             return self.zone_type == other.zone_type
         return False
 
     def __hash__(self) -> int:
         """Return hash."""
-        return hash(self.zone_type)
+        return self._hash
+
+    def __reduce__(self) -> tuple[object, tuple[ExZoneType]]:
+        """Unpickle to the shared instance instead of copying the cached hash.
+
+        ``_hash`` comes from a per-process randomized str hash, so it must
+        not travel between processes.
+        """
+        return ExZone.from_type, (self.zone_type,)
 
     def is_more_hazardous_than(self, other: ExZone) -> bool:
         """Compare hazard levels.
@@ -280,3 +262,30 @@ class ExZone:
             True if this zone is more hazardous (lower number = more hazardous)
         """
         return self.hazard_level < other.hazard_level
+
+
+# One shared instance per zone type; ExZone is immutable
+_INSTANCES: dict[ExZoneType, ExZone] = {
+    zone_type: ExZone(zone_type=zone_type) for zone_type in ExZoneType
+}
+
+# Zone number found in the input -> shared instance
+_ZONE_BY_NUMBER: dict[str, ExZone] = {
+    "0": _INSTANCES[ExZoneType.ZONE_0],
+    "1": _INSTANCES[ExZoneType.ZONE_1],
+    "2": _INSTANCES[ExZoneType.ZONE_2],
+    "20": _INSTANCES[ExZoneType.ZONE_20],
+    "21": _INSTANCES[ExZoneType.ZONE_21],
+    "22": _INSTANCES[ExZoneType.ZONE_22],
+}
+
+
+@lru_cache(maxsize=512)
+def _parse_ex_zone(value: str) -> ExZone | None:
+    """Parse a non-empty zone string (cached; models reuse few values)."""
+    # The first one- or two-digit run is the zone number, whatever
+    # surrounds it ("Zone 1", "zone_20", "Ex-Zone: 2", "1")
+    match = _ZONE_NUMBER_RE.search(value)
+    if match:
+        return _ZONE_BY_NUMBER.get(match.group())
+    return None
@@ -5,8 +5,10 @@ Represents fire resistance ratings in various notations (German, European, etc.)
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import ClassVar
 
 
@@ -19,6 +21,15 @@ class FireRatingStandard(str, Enum):
     UNKNOWN = "unknown"
 
 
+# One pattern for all notations, tried in order on the upper-cased
+# value: German (F90), European (EI30, REI60/90), plain minutes (90 MIN)
+_PATTERN = re.compile(
+    r"^(?:[FTGSW][-_]?(?P<german>\d+)"
+    r"|[REIWMC]+[-_]?(?P<european>\d+)(?:[-/]\d+)?"
+    r"|(?P<minutes>\d+)(?:\s*MIN)?)$"
+)
+
+
 @dataclass(frozen=True, slots=True)
 class FireRating:
     """Value Object for fire resistance rating.
@@ -48,21 +59,14 @@ class FireRating:
     # Common fire rating values for validation
     VALID_MINUTES: ClassVar[set[int]] = {15, 20, 30, 45, 60, 90, 120, 180, 240}
 
-    # Regex patterns for parsing
-    _GERMAN_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
-        r"^[FfTtGgSsWw][-_]?(\d+)$"
-    )
-    _EUROPEAN_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
-        r"^[REIWMCreiwmc]+[-_]?(\d+)(?:[-/](\d+))?$"
-    )
-    _MINUTES_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"^(\d+)(?:\s*min)?$")
-
     def __post_init__(self) -> None:
         """Validate fire rating values."""
         if self.minutes < 0:
             raise ValueError(f"Fire rating minutes cannot be negative: {self.minutes}")
         if self.minutes > 360:
             raise ValueError(f"Fire rating minutes unrealistic: {self.minutes}")
+        # Only a handful of classifications ("F90", "EI30") occur per model
+        object.__setattr__(self, "classification", sys.intern(self.classification))
 
     @classmethod
     def parse(cls, value: str | None) -> FireRating | None:
@@ -85,36 +89,7 @@ class FireRating:
         if not value:
             return None
 
-        value = value.strip().upper()
-
-        # Try German pattern (F30, F60, etc.)
-        if match := cls._GERMAN_PATTERN.match(value):
-            minutes = int(match.group(1))
-            return cls(
-                minutes=minutes,
-                classification=value,
-                standard=FireRatingStandard.GERMAN,
-            )
-
-        # Try European pattern (EI30, REI60, etc.)
-        if match := cls._EUROPEAN_PATTERN.match(value):
-            minutes = int(match.group(1))
-            return cls(
-                minutes=minutes,
-                classification=value,
-                standard=FireRatingStandard.EUROPEAN,
-            )
-
-        # Try simple minutes
-        if match := cls._MINUTES_PATTERN.match(value):
-            minutes = int(match.group(1))
-            return cls(
-                minutes=minutes,
-                classification=f"F{minutes}",
-                standard=FireRatingStandard.GERMAN,
-            )
-
-        return None
+        return _parse_fire_rating(value)
 
     @classmethod
     def from_minutes(cls, minutes: int) -> FireRating:
@@ -128,7 +103,7 @@ class FireRating:
         """
         return cls(
             minutes=minutes,
-            classification=f"F{minutes}",
+            classification=_GERMAN_STR.get(minutes) or f"F{minutes}",
             standard=FireRatingStandard.GERMAN,
         )
 
@@ -146,25 +121,33 @@ class FireRating:
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on minutes."""
-        if isinstance(other, FireRating):
+        if type(other) is FireRating:
             return self.minutes == other.minutes
-        return False
+        return NotImplemented
 
     def __lt__(self, other: FireRating) -> bool:
         """Compare fire ratings."""
-        return self.minutes < other.minutes
+        if type(other) is FireRating:
+            return self.minutes < other.minutes
+        return NotImplemented
 
     def __le__(self, other: FireRating) -> bool:
         """Compare fire ratings."""
-        return self.minutes <= other.minutes
+        if type(other) is FireRating:
+            return self.minutes <= other.minutes
+        return NotImplemented
 
     def __gt__(self, other: FireRating) -> bool:
         """Compare fire ratings."""
-        return self.minutes > other.minutes
+        if type(other) is FireRating:
+            return self.minutes > other.minutes
+        return NotImplemented
 
     def __ge__(self, other: FireRating) -> bool:
         """Compare fire ratings."""
-        return self.minutes >= other.minutes
+        if type(other) is FireRating:
+            return self.minutes >= other.minutes
+        return NotImplemented
 
     def __hash__(self) -> int:
         """Return hash based on minutes."""
@@ -187,7 +170,7 @@ class FireRating:
         Returns:
             German notation string (e.g., "F90")
         """
-        return f"F{self.minutes}"
+        return _GERMAN_STR.get(self.minutes) or f"F{self.minutes}"
 
     def to_european_ei(self) -> str:
         """Convert to European EI notation.
@@ -195,4 +178,43 @@ class FireRating:
         Returns:
             European notation string (e.g., "EI90")
         """
-        return f"EI{self.minutes}"
+        return _EI_STR.get(self.minutes) or f"EI{self.minutes}"
+
+
+# Canonical notation strings for the common ratings
+_GERMAN_STR: dict[int, str] = {
+    minutes: sys.intern(f"F{minutes}") for minutes in FireRating.VALID_MINUTES
+}
+_EI_STR: dict[int, str] = {
+    minutes: sys.intern(f"EI{minutes}") for minutes in FireRating.VALID_MINUTES
+}
+
+
+@lru_cache(maxsize=512)
+def _parse_fire_rating(value: str) -> FireRating | None:
+    """Parse a non-empty fire rating string (cached; models reuse few values)."""
+    value = value.strip().upper()
+
+    match = _PATTERN.match(value)
+    if match is None:
+        return None
+
+    german, european, minutes = match.group("german", "european", "minutes")
+    if german is not None:
+        return FireRating(
+            minutes=int(german),
+            classification=value,
+            standard=FireRatingStandard.GERMAN,
+        )
+    if european is not None:
+        return FireRating(
+            minutes=int(european),
+            classification=value,
+            standard=FireRatingStandard.EUROPEAN,
+        )
+    plain_minutes = int(minutes)
+    return FireRating(
+        minutes=plain_minutes,
+        classification=_GERMAN_STR.get(plain_minutes) or f"F{plain_minutes}",
+        standard=FireRatingStandard.GERMAN,
+    )
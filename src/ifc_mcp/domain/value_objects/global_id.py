@@ -5,6 +5,7 @@ GlobalId is the unique identifier for IFC entities, encoded in base64.
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 
 
@@ -39,6 +40,9 @@ class GlobalId:
                 f"Invalid GlobalId format: '{self.value}'. "
                 "Must be 22 characters using A-Z, a-z, 0-9, _, $"
             )
+        # The same GlobalId string is repeated across relationships, boundaries
+        # and property rows; interning keeps one copy and speeds dict lookups
+        object.__setattr__(self, "value", sys.intern(self.value))
 
     def __str__(self) -> str:
         """Return string representation."""
@@ -54,7 +58,7 @@ class GlobalId:
 
     def __eq__(self, other: object) -> bool:
         """Check equality."""
-        if isinstance(other, GlobalId):
+        if type(other) is GlobalId:
             return self.value == other.value
         if isinstance(other, str):
             return self.value == other
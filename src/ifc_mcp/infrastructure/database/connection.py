@@ -38,8 +38,8 @@ def get_engine() -> AsyncEngine:
             pool_timeout=settings.database_pool_timeout,
             echo=settings.database_echo,
             # Performance optimizations
-            pool_pre_ping=True,  # Check connection health
-            pool_recycle=3600,  # Recycle connections after 1 hour
+            pool_pre_ping=settings.database_pool_pre_ping,  # Extra round trip per checkout
+            pool_recycle=settings.database_pool_recycle,  # Recycle long-lived connections
         )
 
     return _engine
@@ -91,12 +91,15 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 async def init_database() -> None:
     """Initialize database connection pool.
 
-    Call this at application startup.
+    Call this at application startup. Creates the engine and session
+    factory up front so the first request does not pay for them.
     """
     engine = get_engine()
-    # Test the connection
-    async with engine.begin() as conn:
-        await conn.run_sync(lambda _: None)
+    get_session_factory()
+    # Test the connection; checking one out connects (and, the first
+    # time, runs dialect initialization), so no transaction is needed
+    async with engine.connect():
+        pass
 
 
 async def close_database() -> None:
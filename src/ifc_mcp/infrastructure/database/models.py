@@ -13,13 +13,15 @@ from sqlalchemy import (
     DECIMAL,
     Boolean,
     DateTime,
-    Enum,
+    Double,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import (
@@ -31,6 +33,11 @@ from sqlalchemy.orm import (
 from sqlalchemy.sql import func
 
 
+# Characters of element_properties.property_value covered by the
+# (property_name, value prefix) index
+PROPERTY_VALUE_INDEX_PREFIX = 64
+
+
 # =============================================================================
 # Base Class
 # =============================================================================
@@ -42,70 +49,6 @@ class Base(DeclarativeBase):
     pass
 
 
-# =============================================================================
-# Enum Types (matching PostgreSQL enums)
-# =============================================================================
-
-
-class IfcSchemaVersionEnum(str, Enum):
-    """IFC Schema versions."""
-
-    IFC2X3 = "IFC2X3"
-    IFC4 = "IFC4"
-    IFC4X1 = "IFC4X1"
-    IFC4X2 = "IFC4X2"
-    IFC4X3 = "IFC4X3"
-
-
-class ElementCategoryEnum(str, Enum):
-    """Element categories."""
-
-    wall = "wall"
-    wall_standard_case = "wall_standard_case"
-    door = "door"
-    window = "window"
-    slab = "slab"
-    roof_slab = "roof_slab"
-    column = "column"
-    beam = "beam"
-    stair = "stair"
-    ramp = "ramp"
-    curtain_wall = "curtain_wall"
-    covering = "covering"
-    space = "space"
-    opening = "opening"
-    railing = "railing"
-    furniture = "furniture"
-    equipment = "equipment"
-    distribution_element = "distribution_element"
-    other = "other"
-
-
-class ExZoneEnum(str, Enum):
-    """Ex-Zone classifications."""
-
-    zone_0 = "zone_0"
-    zone_1 = "zone_1"
-    zone_2 = "zone_2"
-    zone_20 = "zone_20"
-    zone_21 = "zone_21"
-    zone_22 = "zone_22"
-    none = "none"
-
-
-class PropertyDataTypeEnum(str, Enum):
-    """Property data types."""
-
-    string = "string"
-    integer = "integer"
-    real = "real"
-    boolean = "boolean"
-    logical = "logical"
-    identifier = "identifier"
-    label = "label"
-    text = "text"
-
-
 # =============================================================================
 # ORM Models
 # =============================================================================
@@ -124,7 +67,8 @@ class ProjectORM(Base):
     description: Mapped[str | None] = mapped_column(Text)
     schema_version: Mapped[str] = mapped_column(String(20), nullable=False)
     original_file_path: Mapped[str | None] = mapped_column(String(1024))
-    original_file_hash: Mapped[str | None] = mapped_column(String(64), unique=True)
+    # Raw SHA-256 digest
+    original_file_hash: Mapped[bytes | None] = mapped_column(LargeBinary(32), unique=True)
     authoring_app: Mapped[str | None] = mapped_column(String(255))
     author: Mapped[str | None] = mapped_column(String(255))
     organization: Mapped[str | None] = mapped_column(String(255))
@@ -144,7 +88,9 @@ class ProjectORM(Base):
     )
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
-    # Relationships
+    # Relationships. Large child collections use lazy="raise" so they are
+    # only ever loaded through explicit query options, never one row at a
+    # time; deletes cascade in the database (passive_deletes).
     storeys: Mapped[list["StoreyORM"]] = relationship(
         back_populates="project",
         cascade="all, delete-orphan",
@@ -153,22 +99,32 @@ class ProjectORM(Base):
     elements: Mapped[list["BuildingElementORM"]] = relationship(
         back_populates="project",
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     spaces: Mapped[list["SpaceORM"]] = relationship(
         back_populates="project",
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     element_types: Mapped[list["ElementTypeORM"]] = relationship(
         back_populates="project",
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     materials: Mapped[list["MaterialORM"]] = relationship(
         back_populates="project",
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
     pset_definitions: Mapped[list["PropertySetDefinitionORM"]] = relationship(
         back_populates="project",
         cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
     )
 
 
@@ -196,9 +152,15 @@ class StoreyORM(Base):
     # Relationships
     project: Mapped["ProjectORM"] = relationship(back_populates="storeys")
     elements: Mapped[list["BuildingElementORM"]] = relationship(
-        back_populates="storey"
+        back_populates="storey",
+        lazy="raise",
+        passive_deletes=True,
+    )
+    spaces: Mapped[list["SpaceORM"]] = relationship(
+        back_populates="storey",
+        lazy="raise",
+        passive_deletes=True,
     )
-    spaces: Mapped[list["SpaceORM"]] = relationship(back_populates="storey")
 
     __table_args__ = (
         UniqueConstraint("project_id", "global_id", name="storeys_uk_global_id"),
@@ -231,7 +193,9 @@ class ElementTypeORM(Base):
     # Relationships
     project: Mapped["ProjectORM"] = relationship(back_populates="element_types")
     elements: Mapped[list["BuildingElementORM"]] = relationship(
-        back_populates="element_type"
+        back_populates="element_type",
+        lazy="raise",
+        passive_deletes=True,
     )
     properties: Mapped[list["TypePropertyORM"]] = relationship(
         back_populates="element_type",
@@ -264,6 +228,10 @@ class BuildingElementORM(Base):
         ForeignKey("element_types.id", ondelete="SET NULL"),
     )
 
+    # Storey/type names (denormalized; written once at import)
+    storey_name: Mapped[str | None] = mapped_column(String(255))
+    type_name: Mapped[str | None] = mapped_column(String(255))
+
     global_id: Mapped[str] = mapped_column(String(22), nullable=False)
     ifc_class: Mapped[str] = mapped_column(String(100), nullable=False)
     category: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -272,17 +240,17 @@ class BuildingElementORM(Base):
     object_type: Mapped[str | None] = mapped_column(String(255))
     tag: Mapped[str | None] = mapped_column(String(100))
 
-    # Geometry (denormalized)
-    length_m: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
-    width_m: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
-    height_m: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 4))
-    area_m2: Mapped[Decimal | None] = mapped_column(DECIMAL(12, 4))
-    volume_m3: Mapped[Decimal | None] = mapped_column(DECIMAL(12, 4))
+    # Geometry (denormalized; float like the domain model, no Decimal round trip)
+    length_m: Mapped[float | None] = mapped_column(Double)
+    width_m: Mapped[float | None] = mapped_column(Double)
+    height_m: Mapped[float | None] = mapped_column(Double)
+    area_m2: Mapped[float | None] = mapped_column(Double)
+    volume_m3: Mapped[float | None] = mapped_column(Double)
 
     # Position
-    position_x: Mapped[Decimal | None] = mapped_column(DECIMAL(12, 4))
-    position_y: Mapped[Decimal | None] = mapped_column(DECIMAL(12, 4))
-    position_z: Mapped[Decimal | None] = mapped_column(DECIMAL(12, 4))
+    position_x: Mapped[float | None] = mapped_column(Double)
+    position_y: Mapped[float | None] = mapped_column(Double)
+    position_z: Mapped[float | None] = mapped_column(Double)
 
     # Flags
     is_external: Mapped[bool | None] = mapped_column(Boolean)
@@ -294,10 +262,18 @@ class BuildingElementORM(Base):
     )
 
     # Relationships
-    project: Mapped["ProjectORM"] = relationship(back_populates="elements")
-    storey: Mapped["StoreyORM | None"] = relationship(back_populates="elements")
+    # Element reads use the denormalized names; never load these implicitly
+    project: Mapped["ProjectORM"] = relationship(
+        back_populates="elements",
+        lazy="raise_on_sql",
+    )
+    storey: Mapped["StoreyORM | None"] = relationship(
+        back_populates="elements",
+        lazy="raise_on_sql",
+    )
     element_type: Mapped["ElementTypeORM | None"] = relationship(
-        back_populates="elements"
+        back_populates="elements",
+        lazy="raise_on_sql",
     )
     properties: Mapped[list["ElementPropertyORM"]] = relationship(
         back_populates="element",
@@ -389,6 +365,7 @@ class SpaceORM(Base):
         Index("idx_spaces_storey", "storey_id"),
         Index("idx_spaces_ex_zone", "project_id", "ex_zone"),
         Index("idx_spaces_number", "project_id", "space_number"),
+        Index("idx_spaces_element", "element_id"),
     )
 
 
@@ -414,10 +391,14 @@ class PropertySetDefinitionORM(Base):
     # Relationships
     project: Mapped["ProjectORM"] = relationship(back_populates="pset_definitions")
     element_properties: Mapped[list["ElementPropertyORM"]] = relationship(
-        back_populates="pset_definition"
+        back_populates="pset_definition",
+        lazy="raise",
+        passive_deletes=True,
     )
     type_properties: Mapped[list["TypePropertyORM"]] = relationship(
-        back_populates="pset_definition"
+        back_populates="pset_definition",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -460,7 +441,13 @@ class ElementPropertyORM(Base):
         ),
         Index("idx_props_element", "element_id"),
         Index("idx_props_pset", "pset_definition_id"),
-        Index("idx_props_name_value", "property_name", "property_value"),
+        # Values are unbounded Text; index a prefix so long values cannot
+        # exceed the btree row size limit
+        Index(
+            "idx_props_name_value_prefix",
+            "property_name",
+            text(f"left(property_value, {PROPERTY_VALUE_INDEX_PREFIX})"),
+        ),
     )
 
 
@@ -498,6 +485,7 @@ class TypePropertyORM(Base):
             name="type_props_uk"
         ),
         Index("idx_type_props_type", "type_id"),
+        Index("idx_type_props_pset", "pset_definition_id"),
     )
 
 
@@ -555,7 +543,9 @@ class MaterialORM(Base):
     # Relationships
     project: Mapped["ProjectORM"] = relationship(back_populates="materials")
     element_materials: Mapped[list["ElementMaterialORM"]] = relationship(
-        back_populates="material"
+        back_populates="material",
+        lazy="raise",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -4,11 +4,14 @@ Orchestrates IFC file import: parsing, mapping, and persistence.
 """
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
+from sqlalchemy import insert
+
 from ifc_mcp.domain import (
     BuildingElement,
     ElementCategory,
@@ -20,6 +23,8 @@ from ifc_mcp.domain import (
     Storey,
 )
 from ifc_mcp.infrastructure.database.models import (
+    ElementMaterialORM,
+    ElementTypeORM,
     MaterialORM,
     PropertySetDefinitionORM,
 )
@@ -36,9 +41,18 @@ from ifc_mcp.shared.config import settings
 from ifc_mcp.shared.logging import get_logger
 
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+
 logger = get_logger(__name__)
 
 
+def _to_float(value: Decimal | None) -> float | None:
+    """Convert a parsed Decimal quantity to float."""
+    return None if value is None else float(value)
+
+
 @dataclass
 class ImportResult:
     """Result of IFC import operation."""
@@ -55,6 +69,17 @@ class ImportResult:
     warnings: list[str]
 
 
+@dataclass
+class _ElementBatch:
+    """Element rows mapped for one insert batch."""
+
+    number: int
+    elements: list[BuildingElement]
+    properties: list[dict[str, Any]]
+    quantities: list[dict[str, Any]]
+    materials: list[dict[str, Any]]
+
+
 class IfcImportService:
     """Service for importing IFC files into the database."""
 
@@ -69,7 +94,9 @@ class IfcImportService:
 
         # Lookup caches for mapping during import
         self._storey_map: dict[str, UUID] = {}  # global_id -> UUID
+        self._storey_names: dict[str, str | None] = {}  # global_id -> name
         self._type_map: dict[str, UUID] = {}  # global_id -> UUID
+        self._type_names: dict[str, str | None] = {}  # global_id -> name
         self._element_map: dict[str, UUID] = {}  # global_id -> UUID
         self._material_map: dict[str, UUID] = {}  # name -> UUID
         self._pset_map: dict[str, UUID] = {}  # name -> UUID
@@ -104,7 +131,7 @@ class IfcImportService:
             if existing:
                 raise EntityAlreadyExistsError(
                     "Project",
-                    parsed.file_hash,
+                    parsed.file_hash.hex(),
                     {"existing_project_id": str(existing.id)},
                 )
 
@@ -197,6 +224,7 @@ class IfcImportService:
             )
             domain_storeys.append(storey)
             self._storey_map[parsed.global_id] = storey.id
+            self._storey_names[parsed.global_id] = parsed.name
 
         return await self._uow.storeys.add_batch(domain_storeys)
 
@@ -206,29 +234,25 @@ class IfcImportService:
         types: list[ParsedType],
     ) -> int:
         """Import element types and build lookup map."""
-        from ifc_mcp.infrastructure.database.models import ElementTypeORM
-
-        type_orms = []
+        type_rows: list[dict[str, Any]] = []
         for parsed in types:
             type_id = uuid4()
             self._type_map[parsed.global_id] = type_id
+            self._type_names[parsed.global_id] = parsed.name
 
-            type_orms.append(
-                ElementTypeORM(
-                    id=type_id,
-                    project_id=project_id,
-                    global_id=parsed.global_id,
-                    ifc_class=parsed.ifc_class,
-                    name=parsed.name,
-                    description=parsed.description,
-                )
-            )
+            type_rows.append({
+                "id": type_id,
+                "project_id": project_id,
+                "global_id": parsed.global_id,
+                "ifc_class": parsed.ifc_class,
+                "name": parsed.name,
+                "description": parsed.description,
+            })
 
-        if type_orms:
-            self._uow.session.add_all(type_orms)
-            await self._uow.flush()
+        if type_rows:
+            await self._uow.session.execute(insert(ElementTypeORM), type_rows)
 
-        return len(type_orms)
+        return len(type_rows)
 
     async def _import_materials(
         self,
@@ -236,25 +260,17 @@ class IfcImportService:
         material_names: set[str],
     ) -> int:
         """Import materials and build lookup map."""
-        material_orms = []
+        material_rows: list[dict[str, Any]] = []
 
         for name in material_names:
             mat_id = uuid4()
             self._material_map[name] = mat_id
+            material_rows.append({"id": mat_id, "project_id": project_id, "name": name})
 
-            material_orms.append(
-                MaterialORM(
-                    id=mat_id,
-                    project_id=project_id,
-                    name=name,
-                )
-            )
-
-        if material_orms:
-            self._uow.session.add_all(material_orms)
-            await self._uow.flush()
+        if material_rows:
+            await self._uow.session.execute(insert(MaterialORM), material_rows)
 
-        return len(material_orms)
+        return len(material_rows)
 
     async def _create_pset_definitions(
         self,
@@ -278,22 +294,14 @@ class IfcImportService:
                 pset_names.add(prop.pset_name)
 
         # Create definitions
-        pset_orms = []
+        pset_rows: list[dict[str, Any]] = []
         for name in pset_names:
             pset_id = uuid4()
             self._pset_map[name] = pset_id
+            pset_rows.append({"id": pset_id, "project_id": project_id, "name": name})
 
-            pset_orms.append(
-                PropertySetDefinitionORM(
-                    id=pset_id,
-                    project_id=project_id,
-                    name=name,
-                )
-            )
-
-        if pset_orms:
-            self._uow.session.add_all(pset_orms)
-            await self._uow.flush()
+        if pset_rows:
+            await self._uow.session.execute(insert(PropertySetDefinitionORM), pset_rows)
 
     async def _import_elements(
         self,
@@ -302,26 +310,42 @@ class IfcImportService:
     ) -> tuple[int, int, int]:
         """Import elements in batches.
 
+        Mapping the next batch overlaps with writing the current one: the
+        producer builds rows while the consumer waits on the database. At
+        most two mapped batches are queued.
+
         Returns:
             Tuple of (element_count, property_count, quantity_count)
         """
-        total_elements = 0
-        total_properties = 0
-        total_quantities = 0
+        queue: asyncio.Queue[_ElementBatch | None] = asyncio.Queue(maxsize=2)
+
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                tasks.create_task(self._produce_element_batches(project_id, elements, queue))
+                writer = tasks.create_task(self._write_element_batches(queue))
+        except ExceptionGroup as group:
+            # The first failure cancels the other task; surface it unwrapped
+            raise group.exceptions[0] from None
+
+        return writer.result()
 
-        # Process in batches
+    async def _produce_element_batches(
+        self,
+        project_id: UUID,
+        elements: list[ParsedElement],
+        queue: asyncio.Queue[_ElementBatch | None],
+    ) -> None:
+        """Map parsed elements to insert rows, one queued batch at a time."""
         for i in range(0, len(elements), self._batch_size):
             batch = elements[i : i + self._batch_size]
 
             # Create domain elements
-            domain_elements = []
+            domain_elements = self._map_elements(project_id, batch)
             properties_batch: list[dict[str, Any]] = []
             quantities_batch: list[dict[str, Any]] = []
             materials_batch: list[dict[str, Any]] = []
 
-            for parsed in batch:
-                element = self._map_element(project_id, parsed)
-                domain_elements.append(element)
+            for parsed, element in zip(batch, domain_elements, strict=True):
                 self._element_map[parsed.global_id] = element.id
 
                 # Collect properties
@@ -353,6 +377,7 @@ class IfcImportService:
                     mat_id = self._material_map.get(mat.name)
                     if mat_id:
                         materials_batch.append({
+                            "id": uuid4(),
                             "element_id": element.id,
                             "material_id": mat_id,
                             "layer_order": mat.layer_order,
@@ -360,77 +385,99 @@ class IfcImportService:
                             "is_ventilated": mat.is_ventilated,
                         })
 
-            # Batch insert
-            count = await self._uow.elements.add_batch(domain_elements)
+            await queue.put(_ElementBatch(
+                number=i // self._batch_size + 1,
+                elements=domain_elements,
+                properties=properties_batch,
+                quantities=quantities_batch,
+                materials=materials_batch,
+            ))
+            # Let the writer start on this batch before mapping the next
+            await asyncio.sleep(0)
+
+        await queue.put(None)
+
+    async def _write_element_batches(
+        self,
+        queue: asyncio.Queue[_ElementBatch | None],
+    ) -> tuple[int, int, int]:
+        """Insert queued batches until the producer signals the end."""
+        total_elements = 0
+        total_properties = 0
+        total_quantities = 0
+
+        while (batch := await queue.get()) is not None:
+            count = await self._uow.elements.add_batch(batch.elements)
             total_elements += count
 
-            prop_count = await self._uow.elements.add_properties_batch(properties_batch)
+            prop_count = await self._uow.elements.add_properties_batch(batch.properties)
             total_properties += prop_count
 
-            qty_count = await self._uow.elements.add_quantities_batch(quantities_batch)
+            qty_count = await self._uow.elements.add_quantities_batch(batch.quantities)
             total_quantities += qty_count
 
             # Insert material associations
-            if materials_batch:
-                from ifc_mcp.infrastructure.database.models import ElementMaterialORM
-
-                mat_orms = [
-                    ElementMaterialORM(
-                        id=uuid4(),
-                        element_id=m["element_id"],
-                        material_id=m["material_id"],
-                        layer_order=m["layer_order"],
-                        layer_thickness=m["layer_thickness"],
-                        is_ventilated=m["is_ventilated"],
-                    )
-                    for m in materials_batch
-                ]
-                self._uow.session.add_all(mat_orms)
-
-            await self._uow.flush()
+            if batch.materials:
+                await self._uow.session.execute(
+                    insert(ElementMaterialORM), batch.materials
+                )
+
             logger.debug(
                 "Processed element batch",
-                batch_num=i // self._batch_size + 1,
+                batch_num=batch.number,
                 elements=count,
             )
 
         return total_elements, total_properties, total_quantities
 
-    def _map_element(self, project_id: UUID, parsed: ParsedElement) -> BuildingElement:
-        """Map parsed element to domain entity."""
-        storey_id = None
-        if parsed.storey_global_id:
-            storey_id = self._storey_map.get(parsed.storey_global_id)
-
-        type_id = None
-        if parsed.type_global_id:
-            type_id = self._type_map.get(parsed.type_global_id)
-
-        element = BuildingElement.create(
-            project_id=project_id,
-            global_id=parsed.global_id,
-            ifc_class=parsed.ifc_class,
-            name=parsed.name,
-            description=parsed.description,
-            tag=parsed.tag,
-            storey_id=storey_id,
-            type_id=type_id,
+    def _map_elements(
+        self,
+        project_id: UUID,
+        batch: list[ParsedElement],
+    ) -> list[BuildingElement]:
+        """Map a batch of parsed elements to domain entities."""
+        storey_map = self._storey_map
+        type_map = self._type_map
+
+        elements = BuildingElement.create_many(
+            project_id,
+            (
+                (
+                    parsed.global_id,
+                    parsed.ifc_class,
+                    parsed.name,
+                    parsed.description,
+                    parsed.tag,
+                    storey_map.get(parsed.storey_global_id)
+                    if parsed.storey_global_id
+                    else None,
+                    type_map.get(parsed.type_global_id)
+                    if parsed.type_global_id
+                    else None,
+                )
+                for parsed in batch
+            ),
         )
 
         # Set additional fields
-        element.object_type = parsed.object_type
-        element.length_m = parsed.length_m
-        element.width_m = parsed.width_m
-        element.height_m = parsed.height_m
-        element.area_m2 = parsed.area_m2
-        element.volume_m3 = parsed.volume_m3
-        element.position_x = parsed.position_x
-        element.position_y = parsed.position_y
-        element.position_z = parsed.position_z
-        element.is_external = parsed.is_external
-        element.is_load_bearing = parsed.is_load_bearing
-
-        return element
+        for parsed, element in zip(batch, elements, strict=True):
+            if parsed.storey_global_id:
+                element.storey_name = self._storey_names.get(parsed.storey_global_id)
+            if parsed.type_global_id:
+                element.type_name = self._type_names.get(parsed.type_global_id)
+            element.object_type = parsed.object_type
+            element.length_m = _to_float(parsed.length_m)
+            element.width_m = _to_float(parsed.width_m)
+            element.height_m = _to_float(parsed.height_m)
+            element.area_m2 = _to_float(parsed.area_m2)
+            element.volume_m3 = _to_float(parsed.volume_m3)
+            element.position_x = _to_float(parsed.position_x)
+            element.position_y = _to_float(parsed.position_y)
+            element.position_z = _to_float(parsed.position_z)
+            element.is_external = parsed.is_external
+            element.is_load_bearing = parsed.is_load_bearing
+
+        return elements
 
     async def _import_spaces(
         self,
@@ -448,8 +495,10 @@ class IfcImportService:
         for parsed in spaces:
             # Create building element for space
             storey_id = None
+            storey_name = None
             if parsed.storey_global_id:
                 storey_id = self._storey_map.get(parsed.storey_global_id)
+                storey_name = self._storey_names.get(parsed.storey_global_id)
 
             element = BuildingElement.create(
                 project_id=project_id,
@@ -458,8 +507,9 @@ class IfcImportService:
                 name=parsed.name,
                 storey_id=storey_id,
             )
-            element.volume_m3 = parsed.net_volume or parsed.gross_volume
-            element.area_m2 = parsed.net_floor_area or parsed.gross_floor_area
+            element.storey_name = storey_name
+            element.volume_m3 = _to_float(parsed.net_volume or parsed.gross_volume)
+            element.area_m2 = _to_float(parsed.net_floor_area or parsed.gross_floor_area)
 
             space_elements.append(element)
             self._element_map[parsed.global_id] = element.id
@@ -502,10 +552,14 @@ class IfcImportService:
                     })
 
         # Batch insert elements
-        await self._uow.elements.add_batch(space_elements)
+        await self._uow.elements.add_batch(
+            space_elements, chunk_size=self._batch_size
+        )
 
         # Batch insert spaces
-        count = await self._uow.spaces.add_batch(domain_spaces)
+        count = await self._uow.spaces.add_batch(
+            domain_spaces, chunk_size=self._batch_size
+        )
 
         # Batch insert boundaries
         await self._uow.spaces.add_boundaries_batch(boundaries_batch)
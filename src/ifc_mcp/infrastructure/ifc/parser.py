@@ -165,7 +165,7 @@ class ParsedProject:
     description: str | None = None
     schema_version: IfcSchemaVersion = IfcSchemaVersion.IFC4
     file_path: str | None = None
-    file_hash: str | None = None
+    file_hash: bytes | None = None
     authoring_app: str | None = None
     author: str | None = None
     organization: str | None = None
@@ -256,17 +256,17 @@ class IfcParser:
             unit_scale=self._unit_scale,
         )
 
-    def calculate_file_hash(self) -> str:
+    def calculate_file_hash(self) -> bytes:
         """Calculate SHA-256 hash of file.
 
         Returns:
-            Hex-encoded hash string
+            Raw 32-byte digest
         """
         sha256 = hashlib.sha256()
         with open(self.file_path, "rb") as f:
             for chunk in iter(lambda: f.read(8192), b""):
                 sha256.update(chunk)
-        return sha256.hexdigest()
+        return sha256.digest()
 
     def parse(self) -> ParsedProject:
         """Parse entire IFC file.
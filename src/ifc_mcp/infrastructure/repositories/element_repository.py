@@ -4,11 +4,21 @@ SQLAlchemy-based implementation of IElementRepository.
 """
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    delete,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -21,6 +31,7 @@ from ifc_mcp.domain import (
     QuantityValue,
 )
 from ifc_mcp.infrastructure.database.models import (
+    PROPERTY_VALUE_INDEX_PREFIX,
     BuildingElementORM,
     ElementMaterialORM,
     ElementPropertyORM,
@@ -28,14 +39,69 @@ from ifc_mcp.infrastructure.database.models import (
     MaterialORM,
     PropertySetDefinitionORM,
 )
+from ifc_mcp.infrastructure.repositories.identity_map import IdentityMap
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from sqlalchemy.engine import Row
+
+
+# Basic reads select these columns as plain rows; _to_domain_basic needs
+# nothing else, so building ORM instances for them is wasted work
+_ELEMENT_COLUMNS = tuple(BuildingElementORM.__table__.columns)
+
+# Column order of the records written by the property/quantity batches
+_PROPERTY_COLUMNS = (
+    "id",
+    "element_id",
+    "pset_definition_id",
+    "property_name",
+    "property_value",
+    "data_type",
+    "unit",
+)
+_QUANTITY_COLUMNS = (
+    "id",
+    "element_id",
+    "qto_name",
+    "quantity_name",
+    "quantity_value",
+    "unit",
+    "formula",
+)
+
+
+def _value_prefix_matches(property_value: str) -> ColumnElement[bool]:
+    """Prefix predicate that lets the planner use idx_props_name_value_prefix.
+
+    The length is rendered inline: an expression index only matches an
+    identical expression, not one with a bound parameter.
+    """
+    length: ColumnElement[int] = literal_column(str(PROPERTY_VALUE_INDEX_PREFIX))
+    return (
+        func.left(ElementPropertyORM.property_value, length)
+        == property_value[:PROPERTY_VALUE_INDEX_PREFIX]
+    )
 
 
 class ElementRepository:
     """SQLAlchemy implementation of element repository."""
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize repository with session."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
+        """Initialize repository with session.
+
+        Args:
+            session: Database session
+            identity_map: Per-transaction cache shared by the Unit of Work
+        """
         self._session = session
+        self._identity_map = identity_map if identity_map is not None else IdentityMap()
 
     # =========================================================================
     # Read Operations
@@ -43,21 +109,7 @@ class ElementRepository:
 
     async def get_by_id(self, element_id: UUID) -> BuildingElement | None:
         """Get element by ID with properties loaded."""
-        stmt = (
-            select(BuildingElementORM)
-            .options(
-                selectinload(BuildingElementORM.properties).selectinload(
-                    ElementPropertyORM.pset_definition
-                ),
-                selectinload(BuildingElementORM.quantities),
-                selectinload(BuildingElementORM.materials).selectinload(
-                    ElementMaterialORM.material
-                ),
-                selectinload(BuildingElementORM.storey),
-                selectinload(BuildingElementORM.element_type),
-            )
-            .where(BuildingElementORM.id == element_id)
-        )
+        stmt = self._select_full().where(BuildingElementORM.id == element_id)
         result = await self._session.execute(stmt)
         orm = result.scalar_one_or_none()
 
@@ -66,6 +118,33 @@ class ElementRepository:
 
         return self._to_domain_full(orm)
 
+    async def get_many_by_ids(
+        self,
+        element_ids: Sequence[UUID],
+    ) -> dict[UUID, BuildingElement]:
+        """Get several elements by ID in one query, properties loaded.
+
+        IDs that do not exist are absent from the result.
+        """
+        if not element_ids:
+            return {}
+
+        stmt = self._select_full().where(BuildingElementORM.id.in_(element_ids))
+        result = await self._session.execute(stmt)
+        return {orm.id: self._to_domain_full(orm) for orm in result.scalars().all()}
+
+    def _select_full(self) -> Select[BuildingElementORM]:
+        """Build an element query that eager-loads all child data."""
+        return select(BuildingElementORM).options(
+            selectinload(BuildingElementORM.properties).selectinload(
+                ElementPropertyORM.pset_definition
+            ),
+            selectinload(BuildingElementORM.quantities),
+            selectinload(BuildingElementORM.materials).selectinload(
+                ElementMaterialORM.material
+            ),
+        )
+
     async def get_by_global_id(
         self,
         project_id: UUID,
@@ -109,6 +188,62 @@ class ElementRepository:
         offset: int = 0,
     ) -> list[BuildingElement]:
         """Find elements by criteria."""
+        stmt = (
+            self._select_by_project(
+                project_id,
+                ifc_class=ifc_class,
+                category=category,
+                storey_id=storey_id,
+                is_external=is_external,
+                is_load_bearing=is_load_bearing,
+            )
+            .limit(limit)
+            .offset(offset)
+        )
+
+        result = await self._session.execute(stmt)
+        return [self._to_domain_basic(row) for row in result]
+
+    async def iter_by_project(
+        self,
+        project_id: UUID,
+        *,
+        ifc_class: str | None = None,
+        category: ElementCategory | None = None,
+        storey_id: UUID | None = None,
+        is_external: bool | None = None,
+        is_load_bearing: bool | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[BuildingElement]:
+        """Stream all matching elements without materializing the result.
+
+        Rows are fetched from a server-side cursor in batches of
+        ``batch_size``.
+        """
+        stmt = self._select_by_project(
+            project_id,
+            ifc_class=ifc_class,
+            category=category,
+            storey_id=storey_id,
+            is_external=is_external,
+            is_load_bearing=is_load_bearing,
+        ).execution_options(yield_per=batch_size)
+
+        result = await self._session.stream(stmt)
+        async for row in result:
+            yield self._to_domain_basic(row)
+
+    def _select_by_project(
+        self,
+        project_id: UUID,
+        *,
+        ifc_class: str | None,
+        category: ElementCategory | None,
+        storey_id: UUID | None,
+        is_external: bool | None,
+        is_load_bearing: bool | None,
+    ) -> Select[Any]:
+        """Build the filtered, ordered element query for a project."""
         conditions = [BuildingElementORM.project_id == project_id]
 
         if ifc_class:
@@ -122,21 +257,12 @@ class ElementRepository:
         if is_load_bearing is not None:
             conditions.append(BuildingElementORM.is_load_bearing == is_load_bearing)
 
-        stmt = (
-            select(BuildingElementORM)
-            .options(
-                selectinload(BuildingElementORM.storey),
-                selectinload(BuildingElementORM.element_type),
-            )
+        return (
+            select(*_ELEMENT_COLUMNS)
             .where(and_(*conditions))
             .order_by(BuildingElementORM.name)
-            .limit(limit)
-            .offset(offset)
         )
 
-        result = await self._session.execute(stmt)
-        return [self._to_domain_basic(orm) for orm in result.scalars().all()]
-
     async def find_by_property(
         self,
         project_id: UUID,
@@ -146,23 +272,61 @@ class ElementRepository:
     ) -> list[BuildingElement]:
         """Find elements by property value."""
         stmt = (
-            select(BuildingElementORM)
+            select(*_ELEMENT_COLUMNS)
             .join(BuildingElementORM.properties)
             .join(ElementPropertyORM.pset_definition)
             .where(
                 BuildingElementORM.project_id == project_id,
                 PropertySetDefinitionORM.name == pset_name,
                 ElementPropertyORM.property_name == property_name,
+                _value_prefix_matches(property_value),
                 ElementPropertyORM.property_value == property_value,
             )
-            .options(
-                selectinload(BuildingElementORM.storey),
-                selectinload(BuildingElementORM.element_type),
+        )
+
+        result = await self._session.execute(stmt)
+        return [self._to_domain_basic(row) for row in result]
+
+    async def find_by_properties(
+        self,
+        project_id: UUID,
+        filters: Sequence[tuple[str, str, str]],
+        *,
+        match_all: bool = True,
+    ) -> list[BuildingElement]:
+        """Find elements by several property values in one query.
+
+        Each filter is a ``(pset_name, property_name, property_value)``
+        triple. With ``match_all`` an element must have every property,
+        otherwise any one of them.
+        """
+        if not filters:
+            return []
+
+        matches = [
+            select(ElementPropertyORM.id)
+            .join(ElementPropertyORM.pset_definition)
+            .where(
+                ElementPropertyORM.element_id == BuildingElementORM.id,
+                PropertySetDefinitionORM.name == pset_name,
+                ElementPropertyORM.property_name == property_name,
+                _value_prefix_matches(property_value),
+                ElementPropertyORM.property_value == property_value,
+            )
+            .exists()
+            for pset_name, property_name, property_value in filters
+        ]
+
+        stmt = (
+            select(*_ELEMENT_COLUMNS)
+            .where(
+                BuildingElementORM.project_id == project_id,
+                and_(*matches) if match_all else or_(*matches),
             )
         )
 
         result = await self._session.execute(stmt)
-        return [self._to_domain_basic(orm) for orm in result.scalars().all()]
+        return [self._to_domain_basic(row) for row in result]
 
     async def find_by_material(
         self,
@@ -173,25 +337,18 @@ class ElementRepository:
         keyword_pattern = f"%{material_keyword.lower()}%"
 
         stmt = (
-            select(BuildingElementORM)
+            select(*_ELEMENT_COLUMNS)
             .join(BuildingElementORM.materials)
             .join(ElementMaterialORM.material)
             .where(
                 BuildingElementORM.project_id == project_id,
                 func.lower(MaterialORM.name).like(keyword_pattern),
             )
-            .options(
-                selectinload(BuildingElementORM.storey),
-                selectinload(BuildingElementORM.element_type),
-                selectinload(BuildingElementORM.materials).selectinload(
-                    ElementMaterialORM.material
-                ),
-            )
             .distinct()
         )
 
         result = await self._session.execute(stmt)
-        return [self._to_domain_basic(orm) for orm in result.scalars().all()]
+        return [self._to_domain_basic(row) for row in result]
 
     async def find_with_fire_rating(
         self,
@@ -212,7 +369,6 @@ class ElementRepository:
                 selectinload(BuildingElementORM.properties).selectinload(
                     ElementPropertyORM.pset_definition
                 ),
-                selectinload(BuildingElementORM.storey),
             )
             .distinct()
         )
@@ -260,22 +416,31 @@ class ElementRepository:
         await self._session.flush()
         return element
 
-    async def add_batch(self, elements: list[BuildingElement]) -> int:
+    async def add_batch(
+        self,
+        elements: list[BuildingElement],
+        *,
+        chunk_size: int = 1000,
+    ) -> int:
         """Batch add elements for import performance.
 
+        Rows are written with bulk INSERT statements of ``chunk_size``
+        elements each, bypassing the unit of work; no ORM objects are
+        created or tracked.
+
         Args:
             elements: Elements to add
+            chunk_size: Maximum elements per statement
 
         Returns:
             Count of added elements
         """
-        if not elements:
-            return 0
-
-        orm_objects = [self._to_orm(e) for e in elements]
-        self._session.add_all(orm_objects)
-        await self._session.flush()
-        return len(orm_objects)
+        for start in range(0, len(elements), chunk_size):
+            chunk = elements[start : start + chunk_size]
+            await self._session.execute(
+                insert(BuildingElementORM), [self._to_row(e) for e in chunk]
+            )
+        return len(elements)
 
     async def add_properties_batch(
         self,
@@ -298,21 +463,20 @@ class ElementRepository:
         if not properties:
             return 0
 
-        orm_objects = [
-            ElementPropertyORM(
-                id=uuid4(),
-                element_id=p["element_id"],
-                pset_definition_id=p["pset_definition_id"],
-                property_name=p["property_name"],
-                property_value=p.get("property_value"),
-                data_type=p.get("data_type", "string"),
-                unit=p.get("unit"),
+        records = [
+            (
+                uuid4(),
+                p["element_id"],
+                p["pset_definition_id"],
+                p["property_name"],
+                p.get("property_value"),
+                p.get("data_type", "string"),
+                p.get("unit"),
             )
             for p in properties
         ]
-        self._session.add_all(orm_objects)
-        await self._session.flush()
-        return len(orm_objects)
+        await self._copy_rows(ElementPropertyORM, _PROPERTY_COLUMNS, records)
+        return len(records)
 
     async def add_quantities_batch(
         self,
@@ -329,21 +493,53 @@ class ElementRepository:
         if not quantities:
             return 0
 
-        orm_objects = [
-            ElementQuantityORM(
-                id=uuid4(),
-                element_id=q["element_id"],
-                qto_name=q["qto_name"],
-                quantity_name=q["quantity_name"],
-                quantity_value=q.get("quantity_value"),
-                unit=q.get("unit"),
-                formula=q.get("formula"),
+        records = [
+            (
+                uuid4(),
+                q["element_id"],
+                q["qto_name"],
+                q["quantity_name"],
+                q.get("quantity_value"),
+                q.get("unit"),
+                q.get("formula"),
             )
             for q in quantities
         ]
-        self._session.add_all(orm_objects)
-        await self._session.flush()
-        return len(orm_objects)
+        await self._copy_rows(ElementQuantityORM, _QUANTITY_COLUMNS, records)
+        return len(records)
+
+    async def _copy_rows(
+        self,
+        model: type[ElementPropertyORM] | type[ElementQuantityORM],
+        columns: tuple[str, ...],
+        records: list[tuple[Any, ...]],
+    ) -> None:
+        """Write records with PostgreSQL COPY, falling back to bulk INSERT.
+
+        COPY is used only on asyncpg and only inside the session's open
+        transaction, so the rows commit or roll back with the import.
+        Records are passed to COPY as built; only the fallback converts
+        them to column dicts.
+
+        Args:
+            model: ORM class of the target table
+            columns: Column names, in record order
+            records: Row tuples
+        """
+        conn = await self._session.connection()
+        if conn.dialect.driver == "asyncpg":
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            if driver is not None and driver.is_in_transaction():
+                await driver.copy_records_to_table(
+                    model.__tablename__,
+                    records=records,
+                    columns=list(columns),
+                )
+                return
+
+        rows = [dict(zip(columns, record, strict=True)) for record in records]
+        await self._session.execute(insert(model), rows)
 
     async def update(self, element: BuildingElement) -> BuildingElement:
         """Update an element."""
@@ -366,14 +562,16 @@ class ElementRepository:
         stmt = delete(BuildingElementORM).where(BuildingElementORM.id == element_id)
         result = await self._session.execute(stmt)
         await self._session.flush()
+        # The delete cascades to the element's space and space boundaries
+        self._identity_map.clear()
         return result.rowcount > 0
 
     # =========================================================================
     # Mapping
     # =========================================================================
 
-    def _to_domain_basic(self, orm: BuildingElementORM) -> BuildingElement:
-        """Map ORM to domain model (basic fields only)."""
+    def _to_domain_basic(self, orm: BuildingElementORM | Row[Any]) -> BuildingElement:
+        """Map an ORM instance or element row to domain model (basic fields only)."""
         element = BuildingElement(
             id=orm.id,
             project_id=orm.project_id,
@@ -393,18 +591,13 @@ class ElementRepository:
             position_y=orm.position_y,
             position_z=orm.position_z,
             storey_id=orm.storey_id,
+            storey_name=orm.storey_name,
             type_id=orm.type_id,
+            type_name=orm.type_name,
             is_external=orm.is_external,
             is_load_bearing=orm.is_load_bearing,
             created_at=orm.created_at,
         )
-
-        # Add storey/type names if loaded
-        if orm.storey:
-            element.storey_name = orm.storey.name
-        if orm.element_type:
-            element.type_name = orm.element_type.name
-
         return element
 
     def _to_domain_full(self, orm: BuildingElementORM) -> BuildingElement:
@@ -450,26 +643,32 @@ class ElementRepository:
 
     def _to_orm(self, element: BuildingElement) -> BuildingElementORM:
         """Map domain model to ORM."""
-        return BuildingElementORM(
-            id=element.id,
-            project_id=element.project_id,
-            storey_id=element.storey_id,
-            type_id=element.type_id,
-            global_id=str(element.global_id),
-            ifc_class=element.ifc_class,
-            category=element.category.value,
-            name=element.name,
-            description=element.description,
-            object_type=element.object_type,
-            tag=element.tag,
-            length_m=element.length_m,
-            width_m=element.width_m,
-            height_m=element.height_m,
-            area_m2=element.area_m2,
-            volume_m3=element.volume_m3,
-            position_x=element.position_x,
-            position_y=element.position_y,
-            position_z=element.position_z,
-            is_external=element.is_external,
-            is_load_bearing=element.is_load_bearing,
-        )
+        return BuildingElementORM(**self._to_row(element))
+
+    def _to_row(self, element: BuildingElement) -> dict[str, Any]:
+        """Map domain model to a column dict for bulk INSERT."""
+        return {
+            "id": element.id,
+            "project_id": element.project_id,
+            "storey_id": element.storey_id,
+            "storey_name": element.storey_name,
+            "type_id": element.type_id,
+            "type_name": element.type_name,
+            "global_id": str(element.global_id),
+            "ifc_class": element.ifc_class,
+            "category": element.category.value,
+            "name": element.name,
+            "description": element.description,
+            "object_type": element.object_type,
+            "tag": element.tag,
+            "length_m": element.length_m,
+            "width_m": element.width_m,
+            "height_m": element.height_m,
+            "area_m2": element.area_m2,
+            "volume_m3": element.volume_m3,
+            "position_x": element.position_x,
+            "position_y": element.position_y,
+            "position_z": element.position_z,
+            "is_external": element.is_external,
+            "is_load_bearing": element.is_load_bearing,
+        }
@@ -0,0 +1,45 @@
+"""Identity Map.
+
+Per-transaction cache of entities, shared by the repositories of one
+Unit of Work.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+
+T = TypeVar("T")
+
+
+class IdentityMap:
+    """Entities loaded in one transaction, keyed by type and ID.
+
+    Repositories return the cached instance for rows they have already
+    mapped and evict entries whose rows they update or delete.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty map."""
+        self._entities: dict[tuple[type, UUID], object] = {}
+
+    def get(self, entity_type: type[T], entity_id: UUID) -> T | None:
+        """Get the cached entity, or None if it is not loaded."""
+        entity = self._entities.get((entity_type, entity_id))
+        return entity if isinstance(entity, entity_type) else None
+
+    def add(self, entity_id: UUID, entity: T) -> T:
+        """Cache an entity under its type and ID and return it."""
+        self._entities[(type(entity), entity_id)] = entity
+        return entity
+
+    def discard(self, entity_type: type, entity_id: UUID) -> None:
+        """Evict one entity if it is cached."""
+        self._entities.pop((entity_type, entity_id), None)
+
+    def clear(self) -> None:
+        """Evict all entities."""
+        self._entities.clear()
@@ -4,7 +4,7 @@ SQLAlchemy-based implementation of IProjectRepository.
 """
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Sequence
 from uuid import UUID
 
@@ -19,18 +19,25 @@ from ifc_mcp.domain import (
     Storey,
 )
 from ifc_mcp.infrastructure.database.models import ProjectORM, StoreyORM
+from ifc_mcp.infrastructure.repositories.identity_map import IdentityMap
 
 
 class ProjectRepository:
     """SQLAlchemy implementation of project repository."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
         """Initialize repository with session.
 
         Args:
             session: AsyncSession instance
+            identity_map: Per-transaction cache shared by the Unit of Work
         """
         self._session = session
+        self._identity_map = identity_map if identity_map is not None else IdentityMap()
 
     # =========================================================================
     # Read Operations
@@ -58,11 +65,11 @@ class ProjectRepository:
 
         return self._to_domain(orm)
 
-    async def get_by_file_hash(self, file_hash: str) -> Project | None:
+    async def get_by_file_hash(self, file_hash: bytes) -> Project | None:
         """Get project by file hash for deduplication.
 
         Args:
-            file_hash: SHA-256 hash
+            file_hash: SHA-256 digest
 
         Returns:
             Project or None
@@ -175,7 +182,7 @@ class ProjectRepository:
             .values(
                 name=project.name,
                 description=project.description,
-                updated_at=datetime.utcnow(),
+                updated_at=datetime.now(UTC),
             )
         )
         await self._session.execute(stmt)
@@ -198,11 +205,14 @@ class ProjectRepository:
             stmt = (
                 update(ProjectORM)
                 .where(ProjectORM.id == project_id)
-                .values(deleted_at=datetime.utcnow())
+                .values(deleted_at=datetime.now(UTC))
             )
 
         result = await self._session.execute(stmt)
         await self._session.flush()
+        if hard:
+            # The delete cascades to the project's storeys and spaces
+            self._identity_map.clear()
         return result.rowcount > 0
 
     # =========================================================================
@@ -236,7 +246,7 @@ class ProjectRepository:
 
         # Map storeys if loaded
         if orm.storeys:
-            project.storeys = [
+            project.load_storeys(
                 Storey(
                     id=s.id,
                     project_id=s.project_id,
@@ -247,7 +257,7 @@ class ProjectRepository:
                     created_at=s.created_at,
                 )
                 for s in sorted(orm.storeys, key=lambda x: x.elevation or 0)
-            ]
+            )
 
         return project
 
@@ -5,10 +5,10 @@ SQLAlchemy-based implementation of ISpaceRepository.
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -18,36 +18,79 @@ from ifc_mcp.infrastructure.database.models import (
     SpaceBoundaryORM,
     SpaceORM,
 )
+from ifc_mcp.infrastructure.repositories.identity_map import IdentityMap
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
 
 
 class SpaceRepository:
     """SQLAlchemy implementation of space repository."""
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize repository with session."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
+        """Initialize repository with session.
+
+        Args:
+            session: Database session
+            identity_map: Per-transaction cache shared by the Unit of Work
+        """
         self._session = session
+        self._identity_map = identity_map if identity_map is not None else IdentityMap()
 
     # =========================================================================
     # Read Operations
     # =========================================================================
 
     async def get_by_id(self, space_id: UUID) -> Space | None:
-        """Get space by ID with boundaries loaded."""
-        stmt = (
-            select(SpaceORM)
-            .options(
-                selectinload(SpaceORM.boundaries),
-                selectinload(SpaceORM.storey),
-            )
-            .where(SpaceORM.id == space_id)
-        )
+        """Get space by ID with boundaries loaded.
+
+        Cached for the Unit of Work's transaction.
+        """
+        cached = self._identity_map.get(Space, space_id)
+        if cached is not None:
+            return cached
+
+        stmt = self._select_full().where(SpaceORM.id == space_id)
         result = await self._session.execute(stmt)
         orm = result.scalar_one_or_none()
 
         if orm is None:
             return None
 
-        return self._to_domain_full(orm)
+        return self._cached_or_full(orm)
+
+    async def get_many_by_ids(self, space_ids: Sequence[UUID]) -> dict[UUID, Space]:
+        """Get several spaces by ID in one query, boundaries loaded.
+
+        IDs that do not exist are absent from the result.
+        """
+        spaces: dict[UUID, Space] = {}
+        missing: list[UUID] = []
+        for space_id in space_ids:
+            cached = self._identity_map.get(Space, space_id)
+            if cached is not None:
+                spaces[space_id] = cached
+            else:
+                missing.append(space_id)
+
+        if missing:
+            stmt = self._select_full().where(SpaceORM.id.in_(missing))
+            result = await self._session.execute(stmt)
+            for orm in result.scalars().all():
+                spaces[orm.id] = self._cached_or_full(orm)
+        return spaces
+
+    def _select_full(self) -> Select[SpaceORM]:
+        """Build a space query that eager-loads boundaries and storey."""
+        return select(SpaceORM).options(
+            selectinload(SpaceORM.boundaries),
+            selectinload(SpaceORM.storey),
+        )
 
     async def get_by_global_id(
         self,
@@ -72,7 +115,7 @@ class SpaceRepository:
         if orm is None:
             return None
 
-        return self._to_domain_full(orm)
+        return self._cached_or_full(orm)
 
     async def find_by_project(
         self,
@@ -86,6 +129,58 @@ class SpaceRepository:
         offset: int = 0,
     ) -> list[Space]:
         """Find spaces by criteria."""
+        stmt = (
+            self._select_by_project(
+                project_id,
+                storey_id=storey_id,
+                ex_zone_only=ex_zone_only,
+                hazardous_only=hazardous_only,
+                fire_compartment=fire_compartment,
+            )
+            .limit(limit)
+            .offset(offset)
+        )
+
+        result = await self._session.execute(stmt)
+        return [self._cached_or_basic(orm) for orm in result.scalars().all()]
+
+    async def iter_by_project(
+        self,
+        project_id: UUID,
+        *,
+        storey_id: UUID | None = None,
+        ex_zone_only: bool = False,
+        hazardous_only: bool = False,
+        fire_compartment: str | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Space]:
+        """Stream all matching spaces without materializing the result.
+
+        Rows are fetched from a server-side cursor in batches of
+        ``batch_size``.
+        """
+        stmt = self._select_by_project(
+            project_id,
+            storey_id=storey_id,
+            ex_zone_only=ex_zone_only,
+            hazardous_only=hazardous_only,
+            fire_compartment=fire_compartment,
+        ).execution_options(yield_per=batch_size)
+
+        result = await self._session.stream_scalars(stmt)
+        async for orm in result:
+            yield self._cached_or_basic(orm)
+
+    def _select_by_project(
+        self,
+        project_id: UUID,
+        *,
+        storey_id: UUID | None,
+        ex_zone_only: bool,
+        hazardous_only: bool,
+        fire_compartment: str | None,
+    ) -> Select[SpaceORM]:
+        """Build the filtered, ordered space query for a project."""
         conditions = [SpaceORM.project_id == project_id]
 
         if storey_id:
@@ -97,18 +192,13 @@ class SpaceRepository:
         if fire_compartment:
             conditions.append(SpaceORM.fire_compartment == fire_compartment)
 
-        stmt = (
+        return (
             select(SpaceORM)
             .options(selectinload(SpaceORM.storey))
             .where(and_(*conditions))
             .order_by(SpaceORM.space_number, SpaceORM.name)
-            .limit(limit)
-            .offset(offset)
         )
 
-        result = await self._session.execute(stmt)
-        return [self._to_domain_basic(orm) for orm in result.scalars().all()]
-
     async def find_by_ex_zone(
         self,
         project_id: UUID,
@@ -134,7 +224,7 @@ class SpaceRepository:
         )
 
         result = await self._session.execute(stmt)
-        return [self._to_domain_full(orm) for orm in result.scalars().all()]
+        return [self._cached_or_full(orm) for orm in result.scalars().all()]
 
     async def find_by_fire_compartment(
         self,
@@ -157,7 +247,7 @@ class SpaceRepository:
         )
 
         result = await self._session.execute(stmt)
-        return [self._to_domain_basic(orm) for orm in result.scalars().all()]
+        return [self._cached_or_basic(orm) for orm in result.scalars().all()]
 
     async def get_volume_summary(
         self,
@@ -210,6 +300,25 @@ class SpaceRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
+    async def count_by_ex_zone(self, project_id: UUID) -> dict[ExZoneType, int]:
+        """Count spaces per Ex-Zone with one grouped query.
+
+        Every zone type is present in the result; zones without spaces
+        count 0.
+        """
+        stmt = (
+            select(SpaceORM.ex_zone, func.count(SpaceORM.id))
+            .where(SpaceORM.project_id == project_id)
+            .group_by(SpaceORM.ex_zone)
+        )
+        result = await self._session.execute(stmt)
+
+        counts = dict.fromkeys(ExZoneType, 0)
+        for zone, count in result.all():
+            zone_type = ExZone.parse(zone) if zone else None
+            counts[zone_type.zone_type if zone_type else ExZoneType.NONE] += count
+        return counts
+
     # =========================================================================
     # Write Operations
     # =========================================================================
@@ -221,15 +330,14 @@ class SpaceRepository:
         await self._session.flush()
         return space
 
-    async def add_batch(self, spaces: list[Space]) -> int:
-        """Batch add spaces."""
-        if not spaces:
-            return 0
-
-        orm_objects = [self._to_orm(s) for s in spaces]
-        self._session.add_all(orm_objects)
-        await self._session.flush()
-        return len(orm_objects)
+    async def add_batch(self, spaces: list[Space], *, chunk_size: int = 1000) -> int:
+        """Batch add spaces as bulk INSERTs of ``chunk_size`` rows."""
+        for start in range(0, len(spaces), chunk_size):
+            chunk = spaces[start : start + chunk_size]
+            await self._session.execute(
+                insert(SpaceORM), [self._to_row(s) for s in chunk]
+            )
+        return len(spaces)
 
     async def add_boundaries_batch(
         self,
@@ -251,23 +359,22 @@ class SpaceRepository:
         if not boundaries:
             return 0
 
-        orm_objects = [
-            SpaceBoundaryORM(
-                id=uuid4(),
-                space_id=b["space_id"],
-                element_id=b["element_id"],
-                boundary_type=b.get("boundary_type"),
-                physical_or_virtual=b.get("physical_or_virtual"),
-                internal_or_external=b.get("internal_or_external"),
-            )
+        rows = [
+            {
+                "id": uuid4(),
+                "space_id": b["space_id"],
+                "element_id": b["element_id"],
+                "boundary_type": b.get("boundary_type"),
+                "physical_or_virtual": b.get("physical_or_virtual"),
+                "internal_or_external": b.get("internal_or_external"),
+            }
             for b in boundaries
         ]
-        self._session.add_all(orm_objects)
-        await self._session.flush()
-        return len(orm_objects)
+        await self._session.execute(insert(SpaceBoundaryORM), rows)
+        return len(rows)
 
     async def update(self, space: Space) -> Space:
-        """Update a space."""
+        """Update a space and evict it from the identity map."""
         stmt = (
             select(SpaceORM)
             .where(SpaceORM.id == space.id)
@@ -287,12 +394,30 @@ class SpaceRepository:
             orm.finish_ceiling = space.finish_ceiling
             await self._session.flush()
 
+        self._identity_map.discard(Space, space.id)
         return space
 
     # =========================================================================
     # Mapping
     # =========================================================================
 
+    def _cached_or_full(self, orm: SpaceORM) -> Space:
+        """Return the cached space for a row, mapping and caching it if new."""
+        cached = self._identity_map.get(Space, orm.id)
+        if cached is not None:
+            return cached
+        return self._identity_map.add(orm.id, self._to_domain_full(orm))
+
+    def _cached_or_basic(self, orm: SpaceORM) -> Space:
+        """Return the cached space for a row, or map its basic fields.
+
+        Basic spaces lack boundaries and are not cached.
+        """
+        cached = self._identity_map.get(Space, orm.id)
+        if cached is not None:
+            return cached
+        return self._to_domain_basic(orm)
+
     def _to_domain_basic(self, orm: SpaceORM) -> Space:
         """Map ORM to domain model (basic fields only)."""
         space = Space(
@@ -333,37 +458,43 @@ class SpaceRepository:
 
         # Map boundaries
         if orm.boundaries:
-            for boundary in orm.boundaries:
-                space.add_boundary(
+            space.load_boundaries(
+                SpaceBoundary(
                     element_id=boundary.element_id,
                     boundary_type=boundary.boundary_type,
                     physical_or_virtual=boundary.physical_or_virtual,
                     internal_or_external=boundary.internal_or_external,
                 )
+                for boundary in orm.boundaries
+            )
 
         return space
 
     def _to_orm(self, space: Space) -> SpaceORM:
         """Map domain model to ORM."""
-        return SpaceORM(
-            id=space.id,
-            project_id=space.project_id,
-            storey_id=space.storey_id,
-            element_id=space.element_id,
-            global_id=str(space.global_id),
-            name=space.name,
-            long_name=space.long_name,
-            space_number=space.space_number,
-            net_floor_area=space.net_floor_area,
-            gross_floor_area=space.gross_floor_area,
-            net_volume=space.net_volume,
-            gross_volume=space.gross_volume,
-            net_height=space.net_height,
-            occupancy_type=space.occupancy_type,
-            ex_zone=space.ex_zone.zone_type.value,
-            hazardous_area=space.hazardous_area,
-            fire_compartment=space.fire_compartment,
-            finish_floor=space.finish_floor,
-            finish_wall=space.finish_wall,
-            finish_ceiling=space.finish_ceiling,
-        )
+        return SpaceORM(**self._to_row(space))
+
+    def _to_row(self, space: Space) -> dict[str, Any]:
+        """Map domain model to a column dict for bulk INSERT."""
+        return {
+            "id": space.id,
+            "project_id": space.project_id,
+            "storey_id": space.storey_id,
+            "element_id": space.element_id,
+            "global_id": str(space.global_id),
+            "name": space.name,
+            "long_name": space.long_name,
+            "space_number": space.space_number,
+            "net_floor_area": space.net_floor_area,
+            "gross_floor_area": space.gross_floor_area,
+            "net_volume": space.net_volume,
+            "gross_volume": space.gross_volume,
+            "net_height": space.net_height,
+            "occupancy_type": space.occupancy_type,
+            "ex_zone": space.ex_zone.zone_type.value,
+            "hazardous_area": space.hazardous_area,
+            "fire_compartment": space.fire_compartment,
+            "finish_floor": space.finish_floor,
+            "finish_wall": space.finish_wall,
+            "finish_ceiling": space.finish_ceiling,
+        }
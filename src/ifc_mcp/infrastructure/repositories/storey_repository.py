@@ -13,17 +13,32 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ifc_mcp.domain import Storey
 from ifc_mcp.infrastructure.database.models import StoreyORM
+from ifc_mcp.infrastructure.repositories.identity_map import IdentityMap
 
 
 class StoreyRepository:
     """SQLAlchemy implementation of storey repository."""
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize repository with session."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
+        """Initialize repository with session.
+
+        Args:
+            session: Database session
+            identity_map: Per-transaction cache shared by the Unit of Work
+        """
         self._session = session
+        self._identity_map = identity_map if identity_map is not None else IdentityMap()
 
     async def get_by_id(self, storey_id: UUID) -> Storey | None:
-        """Get storey by ID."""
+        """Get storey by ID (cached for the Unit of Work's transaction)."""
+        cached = self._identity_map.get(Storey, storey_id)
+        if cached is not None:
+            return cached
+
         stmt = select(StoreyORM).where(StoreyORM.id == storey_id)
         result = await self._session.execute(stmt)
         orm = result.scalar_one_or_none()
@@ -31,7 +46,7 @@ class StoreyRepository:
         if orm is None:
             return None
 
-        return self._to_domain(orm)
+        return self._cached_or_load(orm)
 
     async def get_by_project(self, project_id: UUID) -> list[Storey]:
         """Get all storeys for a project, ordered by elevation."""
@@ -41,7 +56,7 @@ class StoreyRepository:
             .order_by(StoreyORM.elevation.asc())
         )
         result = await self._session.execute(stmt)
-        return [self._to_domain(orm) for orm in result.scalars().all()]
+        return [self._cached_or_load(orm) for orm in result.scalars().all()]
 
     async def get_by_global_id(
         self,
@@ -59,7 +74,7 @@ class StoreyRepository:
         if orm is None:
             return None
 
-        return self._to_domain(orm)
+        return self._cached_or_load(orm)
 
     async def add(self, storey: Storey) -> Storey:
         """Add a storey."""
@@ -85,6 +100,13 @@ class StoreyRepository:
         await self._session.flush()
         return len(orm_objects)
 
+    def _cached_or_load(self, orm: StoreyORM) -> Storey:
+        """Return the cached storey for a row, mapping and caching it if new."""
+        cached = self._identity_map.get(Storey, orm.id)
+        if cached is not None:
+            return cached
+        return self._identity_map.add(orm.id, self._to_domain(orm))
+
     def _to_domain(self, orm: StoreyORM) -> Storey:
         """Map ORM to domain model."""
         return Storey(
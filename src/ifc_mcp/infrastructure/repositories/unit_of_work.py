@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ifc_mcp.infrastructure.database.connection import get_session_factory
+from ifc_mcp.infrastructure.repositories.identity_map import IdentityMap
 
 
 if TYPE_CHECKING:
@@ -47,6 +48,9 @@ class UnitOfWork:
         self._elements: ElementRepository | None = None
         self._spaces: SpaceRepository | None = None
 
+        # Entities loaded in this transaction, shared by all repositories
+        self._identity_map = IdentityMap()
+
     async def __aenter__(self) -> "UnitOfWork":
         """Enter async context, create session if needed."""
         if self._owns_session:
@@ -81,7 +85,7 @@ class UnitOfWork:
             from ifc_mcp.infrastructure.repositories.project_repository import (
                 ProjectRepository,
             )
-            self._projects = ProjectRepository(self.session)
+            self._projects = ProjectRepository(self.session, self._identity_map)
         return self._projects
 
     @property
@@ -91,7 +95,7 @@ class UnitOfWork:
             from ifc_mcp.infrastructure.repositories.storey_repository import (
                 StoreyRepository,
             )
-            self._storeys = StoreyRepository(self.session)
+            self._storeys = StoreyRepository(self.session, self._identity_map)
         return self._storeys
 
     @property
@@ -101,7 +105,7 @@ class UnitOfWork:
             from ifc_mcp.infrastructure.repositories.element_repository import (
                 ElementRepository,
             )
-            self._elements = ElementRepository(self.session)
+            self._elements = ElementRepository(self.session, self._identity_map)
         return self._elements
 
     @property
@@ -111,16 +115,18 @@ class UnitOfWork:
             from ifc_mcp.infrastructure.repositories.space_repository import (
                 SpaceRepository,
             )
-            self._spaces = SpaceRepository(self.session)
+            self._spaces = SpaceRepository(self.session, self._identity_map)
         return self._spaces
 
     async def commit(self) -> None:
         """Commit the current transaction."""
         await self.session.commit()
+        self._identity_map.clear()
 
     async def rollback(self) -> None:
         """Rollback the current transaction."""
         await self.session.rollback()
+        self._identity_map.clear()
 
     async def flush(self) -> None:
         """Flush pending changes without committing."""
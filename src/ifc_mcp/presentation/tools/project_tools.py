@@ -169,7 +169,7 @@ async def _list_projects(args: dict[str, Any]) -> list[TextContent]:
                 "name": p.name,
                 "schema_version": p.schema_version.value,
                 "storey_count": len(p.storeys),
-                "imported_at": p.imported_at.isoformat(),
+                "imported_at": p.imported_at.isoformat() if p.imported_at else None,
                 "is_deleted": p.is_deleted,
             }
             for p in projects
@@ -202,7 +202,7 @@ async def _get_project(args: dict[str, Any]) -> list[TextContent]:
         "author": project.author,
         "organization": project.organization,
         "original_file_path": project.original_file_path,
-        "imported_at": project.imported_at.isoformat(),
+        "imported_at": project.imported_at.isoformat() if project.imported_at else None,
         "storeys": [
             {
                 "id": str(s.id),
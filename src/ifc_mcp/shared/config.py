@@ -33,7 +33,9 @@ class Settings(BaseSettings):
     database_echo: bool = False
     database_pool_size: int = 10
     database_max_overflow: int = 20
+    database_pool_timeout: int = 30
     database_pool_recycle: int = 3600
+    database_pool_pre_ping: bool = False  # Enable on networks that drop idle connections
 
     # =========================================================================
     # IFC Import
@@ -2,14 +2,24 @@
 from __future__ import annotations
 
 import asyncio
-from typing import AsyncGenerator, Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
+from ifc_mcp.infrastructure.database.models import Base
 from ifc_mcp.shared.config import Settings
 
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+    from contextlib import AbstractContextManager
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     """Create event loop for async tests."""
@@ -26,3 +36,56 @@ def test_settings() -> Settings:
         database_echo=False,
         log_level="DEBUG",
     )
+
+
+@pytest_asyncio.fixture
+async def db_session(test_settings: Settings) -> AsyncGenerator[AsyncSession, None]:
+    """Session on the test database, rolled back after the test.
+
+    The schema is created inside the same transaction, so nothing is left
+    behind. Skips the test when the database is not reachable.
+    """
+    engine = create_async_engine(test_settings.database_url)
+    try:
+        conn = await engine.connect()
+    except (OSError, SQLAlchemyError) as exc:
+        await engine.dispose()
+        pytest.skip(f"Test database not reachable: {exc}")
+
+    trans = await conn.begin()
+    await conn.run_sync(Base.metadata.create_all)
+    session = AsyncSession(bind=conn, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        await session.close()
+        await trans.rollback()
+        await conn.close()
+        await engine.dispose()
+
+
+@pytest.fixture
+def count_queries() -> Callable[[AsyncSession], AbstractContextManager[list[str]]]:
+    """Record the SQL statements a session executes.
+
+    Example:
+        >>> with count_queries(db_session) as statements:
+        ...     await repo.find_by_project(project_id)
+        >>> assert len(statements) == 1
+    """
+
+    @contextmanager
+    def _count(session: AsyncSession) -> Iterator[list[str]]:
+        statements: list[str] = []
+        bind = session.sync_session.get_bind()
+
+        def before_cursor_execute(**kw: Any) -> None:
+            statements.append(kw["statement"])
+
+        event.listen(bind, "before_cursor_execute", before_cursor_execute, named=True)
+        try:
+            yield statements
+        finally:
+            event.remove(bind, "before_cursor_execute", before_cursor_execute)
+
+    return _count
@@ -0,0 +1,145 @@
+"""Query-count tests for repository read paths.
+
+Lock in that element reads issue a fixed number of statements
+regardless of how many rows they return. Require the PostgreSQL test
+database; skipped when it is not reachable.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ifc_mcp.infrastructure.database.models import (
+    BuildingElementORM,
+    ElementPropertyORM,
+    ElementQuantityORM,
+    ProjectORM,
+    PropertySetDefinitionORM,
+    StoreyORM,
+)
+from ifc_mcp.infrastructure.repositories.element_repository import ElementRepository
+
+
+CountQueries = Callable[[AsyncSession], AbstractContextManager[list[str]]]
+
+ELEMENT_COUNT = 25
+
+
+async def seed_project(session: AsyncSession) -> tuple[UUID, list[UUID]]:
+    """Create a project with one storey and walls carrying a property each."""
+    project_id = uuid4()
+    storey_id = uuid4()
+    pset_id = uuid4()
+    session.add(ProjectORM(id=project_id, name="Query counts", schema_version="IFC4"))
+    await session.flush()
+    session.add_all([
+        StoreyORM(id=storey_id, project_id=project_id, global_id="0" * 22, name="EG"),
+        PropertySetDefinitionORM(id=pset_id, project_id=project_id, name="Pset_WallCommon"),
+    ])
+    await session.flush()
+
+    element_ids = [uuid4() for _ in range(ELEMENT_COUNT)]
+    for i, element_id in enumerate(element_ids, start=1):
+        session.add(BuildingElementORM(
+            id=element_id,
+            project_id=project_id,
+            storey_id=storey_id,
+            storey_name="EG",
+            global_id=f"{i:022d}",
+            ifc_class="IfcWall",
+            category="wall",
+            name=f"Wall {i}",
+        ))
+    await session.flush()
+    for element_id in element_ids:
+        session.add_all([
+            ElementPropertyORM(
+                id=uuid4(),
+                element_id=element_id,
+                pset_definition_id=pset_id,
+                property_name="FireRating",
+                property_value="F90",
+            ),
+            ElementQuantityORM(
+                id=uuid4(),
+                element_id=element_id,
+                qto_name="Qto_WallBaseQuantities",
+                quantity_name="Length",
+                quantity_value=Decimal("1.0"),
+            ),
+        ])
+    await session.flush()
+    session.expunge_all()
+    return project_id, element_ids
+
+
+class TestElementRepositoryQueries:
+    """Element reads must not issue a query per element."""
+
+    async def test_find_by_project_is_one_query(
+        self,
+        db_session: AsyncSession,
+        count_queries: CountQueries,
+    ) -> None:
+        """Test listing elements runs a single statement."""
+        project_id, _ = await seed_project(db_session)
+        repo = ElementRepository(db_session)
+
+        with count_queries(db_session) as statements:
+            elements = await repo.find_by_project(project_id, limit=ELEMENT_COUNT)
+
+        assert len(elements) == ELEMENT_COUNT
+        assert all(e.storey_name == "EG" for e in elements)
+        assert len(statements) == 1
+
+    async def test_find_by_property_is_one_query(
+        self,
+        db_session: AsyncSession,
+        count_queries: CountQueries,
+    ) -> None:
+        """Test property lookup runs a single statement."""
+        project_id, _ = await seed_project(db_session)
+        repo = ElementRepository(db_session)
+
+        with count_queries(db_session) as statements:
+            elements = await repo.find_by_property(
+                project_id, "Pset_WallCommon", "FireRating", "F90"
+            )
+
+        assert len(elements) == ELEMENT_COUNT
+        assert len(statements) == 1
+
+    async def test_get_many_by_ids_query_count_is_bounded(
+        self,
+        db_session: AsyncSession,
+        count_queries: CountQueries,
+    ) -> None:
+        """Test loading full elements does not scale with element count."""
+        _, element_ids = await seed_project(db_session)
+        repo = ElementRepository(db_session)
+
+        with count_queries(db_session) as statements:
+            elements = await repo.get_many_by_ids(element_ids)
+
+        assert len(elements) == ELEMENT_COUNT
+        assert all(e.properties for e in elements.values())
+        # Elements, then one selectin load per relationship
+        assert len(statements) <= 6
+
+    async def test_element_relationships_do_not_lazy_load(
+        self,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test implicit relationship loads raise instead of querying."""
+        _, element_ids = await seed_project(db_session)
+        orm = await db_session.get(BuildingElementORM, element_ids[0])
+        assert orm is not None
+
+        with pytest.raises(InvalidRequestError):
+            _ = orm.storey
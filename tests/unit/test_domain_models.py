@@ -0,0 +1,435 @@
+"""Tests for domain models."""
+from __future__ import annotations
+
+import os
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from ifc_mcp.domain.models import (
+    BuildingElement,
+    ElementCategory,
+    IfcSchemaVersion,
+    Project,
+    Space,
+    SpaceBoundary,
+    Storey,
+)
+
+
+GID = "2XQ$n5SLP5MBLyL442paFx"
+
+
+def make_element(ifc_class: str = "IfcWall") -> BuildingElement:
+    """Create a minimal element for tests."""
+    return BuildingElement.create(
+        project_id=uuid4(),
+        global_id=GID,
+        ifc_class=ifc_class,
+    )
+
+
+class TestBuildingElement:
+    """Tests for BuildingElement entity."""
+
+    def test_create_maps_category(self) -> None:
+        """Test factory derives category from IFC class."""
+        element = make_element("IfcDoor")
+        assert element.category == ElementCategory.DOOR
+        assert str(element.global_id) == GID
+
+    def test_property_access(self) -> None:
+        """Test setting and reading properties."""
+        element = make_element()
+        element.set_property("Pset_WallCommon", "FireRating", "F90")
+        element.set_property("Pset_WallCommon", "IsExternal", True, "boolean")
+
+        assert element.get_property_value("Pset_WallCommon", "FireRating") == "F90"
+        assert element.get_property("Pset_WallCommon", "Missing") is None
+        assert element.get_property("Pset_Other", "FireRating") is None
+        assert set(element.properties["Pset_WallCommon"]) == {"FireRating", "IsExternal"}
+
+    def test_properties_view_refreshes_after_set(self) -> None:
+        """Test nested properties view reflects later writes."""
+        element = make_element()
+        element.set_property("Pset_WallCommon", "FireRating", "F30")
+        assert "Pset_DoorCommon" not in element.properties
+
+        element.set_property("Pset_DoorCommon", "FireRating", "T30")
+        assert element.properties["Pset_DoorCommon"]["FireRating"].value == "T30"
+
+    def test_fire_rating_from_properties(self) -> None:
+        """Test derived fire rating lookup."""
+        element = make_element()
+        element.set_property("Pset_WallCommon", "FireRating", "F90")
+        assert element.fire_rating is not None
+        assert element.fire_rating.minutes == 90
+
+    def test_batch_lookups(self) -> None:
+        """Test batch property and quantity lookups keep key order."""
+        element = make_element()
+        element.set_property("Pset_WallCommon", "FireRating", "F90")
+        element.set_quantity("Qto_WallBaseQuantities", "Length", 2.5)
+
+        assert element.get_properties_batch(
+            [("Pset_DoorCommon", "FireRating"), ("Pset_WallCommon", "FireRating")]
+        ) == [None, "F90"]
+        lengths = element.get_quantities_batch(
+            [("Qto_WallBaseQuantities", "Length"), ("Qto_WallBaseQuantities", "Width")]
+        )
+        assert lengths[1] is None
+        assert lengths[0] is not None
+        assert float(lengths[0]) == 2.5
+
+    def test_create_generates_unique_ids(self) -> None:
+        """Test fast element IDs are unique and secure IDs are uuid4."""
+        project_id = uuid4()
+        ids = {
+            BuildingElement.create(project_id, GID, "IfcWall").id for _ in range(1000)
+        }
+        assert len(ids) == 1000
+
+        element = BuildingElement.create(project_id, GID, "IfcWall", secure_id=True)
+        assert element.id.version == 4
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_process_gets_new_id_prefix(self) -> None:
+        """Test a forked child does not repeat the parent's element IDs."""
+        project_id = uuid4()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                child_id = BuildingElement.create(project_id, GID, "IfcWall").id
+                os.write(write_fd, child_id.bytes)
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        parent_id = BuildingElement.create(project_id, GID, "IfcWall").id
+        with os.fdopen(read_fd, "rb") as pipe:
+            child_bytes = pipe.read()
+        os.waitpid(pid, 0)
+
+        assert child_bytes[:8] != parent_id.bytes[:8]
+
+    def test_create_leaves_timestamp_to_database(self) -> None:
+        """Test new elements carry no client-side timestamp."""
+        assert make_element().created_at is None
+
+    def test_is_drywall_heuristics(self) -> None:
+        """Test drywall detection by material, type name and load bearing."""
+        element = make_element()
+        assert not element.is_drywall
+
+        element.add_material("Knauf GKB 12.5")
+        assert element.is_drywall
+
+        typed = make_element("IfcCovering")
+        typed.type_name = "Trockenbau W112"
+        assert typed.is_drywall
+
+        partition = make_element()
+        partition.is_load_bearing = False
+        assert partition.is_drywall
+
+    def test_create_reuses_parsed_global_id(self) -> None:
+        """Test repeated GlobalId strings share one validated instance."""
+        first = make_element()
+        second = make_element()
+        assert first.global_id is second.global_id
+
+    def test_create_rejects_invalid_global_id(self) -> None:
+        """Test invalid GlobalIds still raise."""
+        with pytest.raises(ValueError, match="Invalid GlobalId format"):
+            BuildingElement.create(uuid4(), "invalid", "IfcWall")
+
+    def test_equality_and_hash_by_id(self) -> None:
+        """Test elements compare and hash by ID."""
+        element = make_element()
+        same = BuildingElement(
+            id=element.id,
+            project_id=element.project_id,
+            global_id=element.global_id,
+            ifc_class="IfcWall",
+            category=ElementCategory.WALL,
+            name="Copy",
+        )
+
+        assert element == same
+        assert hash(element) == hash(same)
+        assert element != make_element()
+        assert len({element, same}) == 1
+
+    def test_collections_are_empty_by_default(self) -> None:
+        """Test elements without data expose empty collections."""
+        element = make_element()
+        assert element.properties == {}
+        assert element.quantities == {}
+        assert element.materials == ()
+        assert element.primary_material is None
+        assert element.get_quantity("Qto_WallBaseQuantities", "Length") is None
+        assert element.get_properties_batch([("Pset_WallCommon", "FireRating")]) == [None]
+
+    def test_collection_views_are_read_only(self) -> None:
+        """Test writes through the collection views fail instead of being lost."""
+        element = make_element()
+        element.set_property("Pset_WallCommon", "FireRating", "F90")
+        element.set_quantity("Qto_WallBaseQuantities", "Length", 2.5)
+        element.add_material("Concrete")
+
+        with pytest.raises(TypeError):
+            element.properties["Pset_WallCommon"]["IsExternal"] = None  # type: ignore[index]
+        with pytest.raises(TypeError):
+            element.quantities["Qto_WallBaseQuantities"]["Width"] = None  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            element.materials.append(None)  # type: ignore[attr-defined]
+        with pytest.raises(TypeError):
+            make_element().quantities["Qto_WallBaseQuantities"] = {}  # type: ignore[index]
+
+    def test_create_many_matches_create(self) -> None:
+        """Test bulk factory maps rows like the single-element factory."""
+        project_id = uuid4()
+        storey_id = uuid4()
+        elements = BuildingElement.create_many(
+            project_id,
+            [
+                (GID, "IfcWall", "W1", None, "T1", storey_id, None),
+                (GID, "IfcWall", "W2", "desc", None, None, None),
+                (GID, "IfcDoor", "D1", None, None, None, None),
+                (GID, "IfcUnknownThing", None, None, None, None, None),
+            ],
+        )
+
+        assert [e.category for e in elements] == [
+            ElementCategory.WALL,
+            ElementCategory.WALL,
+            ElementCategory.DOOR,
+            ElementCategory.OTHER,
+        ]
+        assert elements[0].storey_id == storey_id
+        assert elements[0].tag == "T1"
+        assert elements[1].description == "desc"
+        assert all(e.project_id == project_id for e in elements)
+        assert len({e.id for e in elements}) == 4
+
+    def test_geometry_decimal_accessors(self) -> None:
+        """Test float geometry converts to exact Decimal on request."""
+        element = make_element()
+        element.length_m = 2.4
+        element.position_z = 0.1
+
+        assert element.length_m_decimal == Decimal("2.4")
+        assert element.width_m_decimal is None
+        assert element.position_decimal == (None, None, Decimal("0.1"))
+
+    def test_optional_fields_are_keyword_only(self) -> None:
+        """Test only the identifying fields are positional."""
+        element = make_element()
+        with pytest.raises(TypeError):
+            BuildingElement(  # type: ignore[misc]
+                element.id,
+                element.project_id,
+                element.global_id,
+                "IfcWall",
+                ElementCategory.WALL,
+                "positional name",
+            )
+        assert not hasattr(element, "__dict__")
+
+
+class TestProject:
+    """Tests for Project aggregate."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("IFC4", IfcSchemaVersion.IFC4),
+            ("IFC2X3", IfcSchemaVersion.IFC2X3),
+            ("ifc2x3 tc1", IfcSchemaVersion.IFC2X3),
+            ("IFC4X3_ADD2", IfcSchemaVersion.IFC4X3),
+            ("IFC4 ADD2 TC1", IfcSchemaVersion.IFC4),
+            ("unknown", IfcSchemaVersion.IFC4),
+        ],
+    )
+    def test_schema_version_from_string(
+        self,
+        value: str,
+        expected: IfcSchemaVersion,
+    ) -> None:
+        """Test parsing schema version variants."""
+        assert IfcSchemaVersion.from_string(value) is expected
+
+    def test_create_parses_schema_version(self) -> None:
+        """Test factory accepts schema version strings."""
+        project = Project.create("Test", "IFC2X3 TC1")
+        assert project.schema_version == IfcSchemaVersion.IFC2X3
+        assert not hasattr(project, "__dict__")
+
+    def test_create_sets_timestamps_once(self) -> None:
+        """Test factory stamps all project timestamps with one UTC time."""
+        project = Project.create("Test", "IFC4")
+        assert project.created_at is not None
+        assert project.created_at.tzinfo is not None
+        assert project.created_at == project.updated_at == project.imported_at
+
+    def test_storey_lookup(self) -> None:
+        """Test storeys can be found by name and elevation."""
+        project = Project.create("Test", "IFC4")
+        ground = Storey.create(project.id, GID, name="EG", elevation=0.0)
+        first = Storey.create(project.id, GID, name="OG1", elevation=3.0)
+        project.add_storey(ground)
+        project.add_storey(first)
+
+        assert project.get_storey_by_name("OG1") is first
+        assert project.get_storey_by_name("DG") is None
+        assert project.get_storey_by_elevation(3.005) is first
+        assert project.get_storey_by_elevation(1.5) is None
+
+    def test_storey_lookup_after_reassigning_storeys(self) -> None:
+        """Test lookups follow a replaced storeys list."""
+        project = Project.create("Test", "IFC4")
+        project.add_storey(Storey.create(project.id, GID, name="EG", elevation=0.0))
+        assert project.get_storey_by_name("EG") is not None
+
+        roof = Storey.create(project.id, GID, name="DG", elevation=9.0)
+        project.storeys = [roof]
+        assert project.get_storey_by_name("EG") is None
+        assert project.get_storey_by_elevation(9.0) is roof
+
+        project.storeys.append(Storey.create(project.id, GID, name="OG", elevation=6.0))
+        assert project.get_storey_by_name("OG") is not None
+
+        project.load_storeys(
+            Storey.create(project.id, GID, name=name, elevation=elevation)
+            for name, elevation in (("UG", -3.0), ("EG", 0.0))
+        )
+        assert len(project.storeys) == 2
+        assert project.get_storey_by_elevation(-3.0).name == "UG"
+        assert project.get_storey_by_name("DG") is None
+
+    def test_entity_equality_by_id(self) -> None:
+        """Test projects and storeys compare and hash by ID."""
+        project = Project.create("Test", "IFC4")
+        renamed = Project.create("Other", "IFC2X3")
+        renamed.id = project.id
+        assert project == renamed
+        assert len({project, renamed}) == 1
+
+        storey = Storey.create(project.id, GID, name="EG")
+        same = Storey(id=storey.id, project_id=project.id, global_id=GID, name="OG")
+        assert storey == same
+        assert hash(storey) == hash(same)
+        assert storey != Storey.create(project.id, GID, name="EG")
+
+
+class TestSpace:
+    """Tests for Space entity."""
+
+    def test_boundaries_by_class(self) -> None:
+        """Test boundary filters and external count."""
+        space = Space.create(uuid4(), uuid4(), GID, name="Office", space_number="1.01")
+        space.add_boundary(
+            uuid4(), element_class="IfcWallStandardCase", internal_or_external="EXTERNAL"
+        )
+        space.add_boundary(uuid4(), element_class="IfcDoor", internal_or_external="INTERNAL")
+        space.add_boundary(uuid4(), element_class="IfcWindow", internal_or_external="EXTERNAL")
+
+        assert len(space.get_boundary_walls()) == 1
+        assert len(space.get_boundary_doors()) == 1
+        assert len(space.get_boundary_windows()) == 1
+        assert space.external_boundary_count == 2
+        assert space.has_external_boundaries
+
+        walls, doors, windows = space.categorize_boundaries()
+        assert (len(walls), len(doors), len(windows)) == (1, 1, 1)
+        assert space.display_name == "1.01 - Office"
+        assert not hasattr(space, "__dict__")
+
+    def test_boundary_buckets_follow_reassignment(self) -> None:
+        """Test boundary filters reflect a replaced boundaries list."""
+        space = Space.create(uuid4(), uuid4(), GID)
+        space.add_boundary(uuid4(), element_class="IfcWall")
+        assert len(space.get_boundary_walls()) == 1
+
+        space.boundaries = [
+            SpaceBoundary(uuid4(), element_class="IfcCurtainWall"),
+            SpaceBoundary(uuid4(), element_class="IfcDoor", internal_or_external="EXTERNAL"),
+        ]
+        assert len(space.get_boundary_walls()) == 1
+        assert space.get_boundary_walls()[0].element_class == "IfcCurtainWall"
+        assert space.external_boundary_count == 1
+
+        space.add_boundary(uuid4(), element_class="IfcWindow")
+        assert len(space.get_boundary_windows()) == 1
+
+    def test_boundary_filters_return_copies(self) -> None:
+        """Test mutating a returned boundary list does not change the space."""
+        space = Space.create(uuid4(), uuid4(), GID)
+        space.add_boundary(uuid4(), element_class="IfcWall")
+
+        space.get_boundary_walls().clear()
+        space.categorize_boundaries()[0].clear()
+
+        assert len(space.get_boundary_walls()) == 1
+        assert [b.element_class for b in space.iter_boundary_walls()] == ["IfcWall"]
+        assert not any(space.iter_boundary_doors())
+
+    def test_create_leaves_timestamp_to_database(self) -> None:
+        """Test new spaces carry no client-side timestamp."""
+        assert Space.create(uuid4(), uuid4(), GID).created_at is None
+
+    def test_display_name(self) -> None:
+        """Test display name combines number and name."""
+        space = Space.create(uuid4(), uuid4(), GID, name="Office", space_number="1.01")
+        assert space.display_name == "1.01 - Office"
+        assert Space.create(uuid4(), uuid4(), GID).display_name == GID
+
+    def test_display_name_follows_rename(self) -> None:
+        """Test display name reflects later name and number changes."""
+        space = Space.create(uuid4(), uuid4(), GID, name="Office", space_number="1.01")
+        assert space.display_name == "1.01 - Office"
+
+        space.name = "Meeting"
+        space.space_number = "1.02"
+        assert space.display_name == "1.02 - Meeting"
+
+    def test_load_boundaries(self) -> None:
+        """Test bulk loading boundaries from a generator."""
+        space = Space.create(uuid4(), uuid4(), GID)
+        space.add_boundary(uuid4(), element_class="IfcWindow")
+        space.load_boundaries(
+            SpaceBoundary(uuid4(), element_class=cls) for cls in ("IfcWall", "IfcDoor")
+        )
+        assert len(space.boundaries) == 2
+        assert len(space.get_boundary_doors()) == 1
+        assert space.get_boundary_windows() == []
+
+    def test_boundary_strings_are_interned(self) -> None:
+        """Test enumerated boundary strings share one object per value."""
+        first = SpaceBoundary(uuid4(), internal_or_external="".join(["EXT", "ERNAL"]))
+        second = SpaceBoundary(uuid4(), internal_or_external="".join(["EXTER", "NAL"]))
+        assert first.internal_or_external is second.internal_or_external
+
+    def test_ex_zone_defaults_to_none(self) -> None:
+        """Test new spaces are non-hazardous."""
+        space = Space.create(uuid4(), uuid4(), GID)
+        assert not space.is_hazardous
+        space.set_ex_zone("Zone 1")
+        assert space.is_hazardous
+        assert space.required_equipment_category == 2
+
+        other = Space.create(uuid4(), uuid4(), GID)
+        assert other.ex_zone is Space.create(uuid4(), uuid4(), GID).ex_zone
+
+    def test_ventilation_calculations(self) -> None:
+        """Test ventilation ratio and air change estimates."""
+        space = Space.create(uuid4(), uuid4(), GID)
+        assert space.calculate_ventilation_ratio(2.0) is None
+
+        space.net_floor_area = Decimal("20")
+        space.net_volume = Decimal("50")
+        assert space.calculate_ventilation_ratio(2.0) == pytest.approx(0.1)
+        assert space.calculate_ventilation_ratio(Decimal("5")) == pytest.approx(0.25)
+        assert space.estimate_air_changes_per_hour(100.0) == pytest.approx(2.0)
@@ -0,0 +1,65 @@
+"""Tests for the Unit of Work identity map."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+from ifc_mcp.domain.models import Space, Storey
+from ifc_mcp.infrastructure.repositories.identity_map import IdentityMap
+from ifc_mcp.infrastructure.repositories.space_repository import SpaceRepository
+
+
+GID = "2XQ$n5SLP5MBLyL442paFx"
+
+
+class FakeSession:
+    """Session stub whose queries find no rows."""
+
+    def __init__(self) -> None:
+        self.statements: list[Any] = []
+
+    async def execute(self, stmt: Any, *args: Any) -> Any:
+        self.statements.append(stmt)
+        return SimpleNamespace(scalar_one_or_none=lambda: None)
+
+    async def flush(self) -> None:
+        pass
+
+
+class TestIdentityMap:
+    """Tests for IdentityMap."""
+
+    def test_get_is_keyed_by_type(self) -> None:
+        """Test entities of another type with the same ID are not returned."""
+        identity_map = IdentityMap()
+        space = Space.create(project_id=uuid4(), element_id=uuid4(), global_id=GID)
+        identity_map.add(space.id, space)
+
+        assert identity_map.get(Space, space.id) is space
+        assert identity_map.get(Storey, space.id) is None
+
+    def test_discard_evicts_entity(self) -> None:
+        """Test discard removes a cached entity."""
+        identity_map = IdentityMap()
+        space = Space.create(project_id=uuid4(), element_id=uuid4(), global_id=GID)
+        identity_map.add(space.id, space)
+
+        identity_map.discard(Space, space.id)
+
+        assert identity_map.get(Space, space.id) is None
+
+    async def test_space_update_evicts_cached_space(self) -> None:
+        """Test get_by_id reloads a space after it was updated."""
+        session = FakeSession()
+        identity_map = IdentityMap()
+        repository = SpaceRepository(session, identity_map)  # type: ignore[arg-type]
+        space = Space.create(project_id=uuid4(), element_id=uuid4(), global_id=GID)
+        identity_map.add(space.id, space)
+
+        assert await repository.get_by_id(space.id) is space
+        assert session.statements == []
+
+        await repository.update(space)
+
+        assert identity_map.get(Space, space.id) is None
@@ -0,0 +1,56 @@
+"""Tests for the material takeoff service."""
+from __future__ import annotations
+
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+from ifc_mcp.application.services.material_takeoff_service import (
+    CostGroup,
+    MaterialTakeoffService,
+)
+from ifc_mcp.domain.models import BuildingElement
+
+
+GID = "2XQ$n5SLP5MBLyL442paFx"
+
+
+class FakeUnitOfWork:
+    """Unit of work stub serving a fixed element list."""
+
+    def __init__(self, elements: list[BuildingElement]) -> None:
+        self.projects = SimpleNamespace(get=self._get_project)
+        self.elements = SimpleNamespace(find_by_project=self._find_elements)
+        self.spaces = SimpleNamespace(find_by_project=self._find_spaces)
+        self._elements = elements
+
+    async def _get_project(self, project_id: UUID) -> Any:
+        return SimpleNamespace(id=project_id, name="Test")
+
+    async def _find_elements(self, project_id: UUID, **kwargs: Any) -> list[BuildingElement]:
+        return self._elements
+
+    async def _find_spaces(self, project_id: UUID, **kwargs: Any) -> list[Any]:
+        return []
+
+
+class TestMaterialTakeoffService:
+    """Tests for MaterialTakeoffService."""
+
+    async def test_wall_area_from_float_geometry(self) -> None:
+        """Test wall area uses element length and height."""
+        wall = BuildingElement.create(project_id=uuid4(), global_id=GID, ifc_class="IfcWall")
+        wall.length_m = 4.5
+        wall.height_m = 2.5
+        wall.width_m = 0.24
+        wall.is_external = True
+        wall.is_load_bearing = True
+
+        service = MaterialTakeoffService(FakeUnitOfWork([wall]))  # type: ignore[arg-type]
+        result = await service.generate_takeoff(uuid4())
+
+        assert result.total_wall_area_m2 == Decimal("11.25")
+        item = result.categories[0].items[0]
+        assert item.cost_group == CostGroup.KG_331
+        assert item.details["avg_thickness_m"] == 0.24
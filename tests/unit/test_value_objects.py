@@ -1,6 +1,9 @@
 """Tests for domain value objects."""
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
 
 from ifc_mcp.domain.value_objects import (
@@ -36,6 +39,11 @@ class TestGlobalId:
         gid2 = GlobalId("2XQ$n5SLP5MBLyL442paFx")
         assert gid1 == gid2
 
+    def test_global_id_value_is_interned(self) -> None:
+        """Test equal GlobalIds share one string object."""
+        raw = "".join(["2XQ$n5SLP5", "MBLyL442paFx"])
+        assert GlobalId(raw).value is GlobalId("2XQ$n5SLP5MBLyL442paFx").value
+
     def test_global_id_from_string(self) -> None:
         """Test from_string factory."""
         gid = GlobalId.from_string("2XQ$n5SLP5MBLyL442paFx")
@@ -99,6 +107,14 @@ class TestFireRating:
         assert f60.meets_requirement(30)
         assert not f60.meets_requirement(90)
 
+    def test_fire_rating_comparison_with_other_types(self) -> None:
+        """Test comparing with non-FireRating values."""
+        f30 = FireRating.parse("F30")
+        assert f30 is not None
+        assert f30 != 30
+        with pytest.raises(TypeError):
+            f30 < 60  # noqa: B015
+
     def test_fire_rating_conversions(self) -> None:
         """Test rating format conversions."""
         rating = FireRating.parse("EI90")
@@ -123,6 +139,7 @@ class TestExZone:
             ("1", ExZoneType.ZONE_1),
             ("zone_1", ExZoneType.ZONE_1),
             ("Ex-Zone 2", ExZoneType.ZONE_2),
+            ("Ex-Zone: 21", ExZoneType.ZONE_21),
         ],
     )
     def test_parse_valid_zones(
@@ -138,9 +155,30 @@ class TestExZone:
     def test_parse_invalid_zone(self) -> None:
         """Test parsing invalid zone returns None."""
         assert ExZone.parse("invalid") is None
+        assert ExZone.parse("Zone 3") is None
         assert ExZone.parse("") is None
         assert ExZone.parse(None) is None
 
+    def test_instances_are_shared(self) -> None:
+        """Test zones of the same type are one shared instance."""
+        assert ExZone.parse("Zone 1") is ExZone.from_type(ExZoneType.ZONE_1)
+        assert ExZone.none() is ExZone.none()
+        assert hash(ExZone(zone_type=ExZoneType.ZONE_1)) == hash(ExZone.parse("1"))
+        assert {ExZone.parse("Zone 2"), ExZone(zone_type=ExZoneType.ZONE_2)} == {
+            ExZone.from_type(ExZoneType.ZONE_2)
+        }
+
+    def test_unpickles_to_shared_instance(self) -> None:
+        """Test pickling round-trips to the shared flyweight instance."""
+        zone = ExZone.from_type(ExZoneType.ZONE_1)
+        assert pickle.loads(pickle.dumps(zone)) is zone
+        assert copy.deepcopy(zone) is zone
+
+    def test_zone_str(self) -> None:
+        """Test zone string representation."""
+        assert str(ExZone.from_type(ExZoneType.ZONE_21)) == "Zone 21"
+        assert str(ExZone.none()) == "No Ex-Zone"
+
     def test_zone_properties(self) -> None:
         """Test zone property methods."""
         zone0 = ExZone.parse("Zone 0")